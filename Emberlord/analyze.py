@@ -0,0 +1,118 @@
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import evaluation
+import logic
+import search
+
+# Positions in flight per worker; keeps memory flat on very large inputs
+WINDOW_PER_WORKER = 4
+
+# Evaluation shared by every analysis in this process (set up once per worker)
+worker_evaluate = search.material_eval
+
+
+# Worker initializer: load the weights file once per process
+def init_worker(weights_path):
+    global worker_evaluate
+    worker_evaluate = evaluation.Evaluator.from_file(weights_path) if weights_path else search.material_eval
+
+
+# Analyse one position line; errors are reported in the record instead of stopping the job
+def analyze(job):
+    index, text, depth, seconds = job
+    record = {"index": index, "position": text}
+    game = logic.GameLogic()
+    try:
+        game.load_position(text)
+    except ValueError as e:
+        record["error"] = str(e)
+        return record
+    result = game.result()
+    if result is not None:
+        record["result"] = result
+        return record
+    record.update(search.Searcher(evaluate=worker_evaluate).search(game, depth, seconds).as_dict())
+    return record
+
+
+# Position lines from a text stream; blank lines and '#' comments are skipped
+def read_positions(stream):
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield line
+
+
+# Number of complete records already in `path`; a torn last line from a crash is cut off
+def completed_records(path):
+    if not os.path.exists(path):
+        return 0
+    with open(path, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end != len(data):
+            f.truncate(end)
+    return data.count(b"\n", 0, end)
+
+
+# Run analyze over `jobs` and yield the records in input order, with at most `window` jobs pending
+def ordered_results(jobs, workers, window, initargs):
+    if workers <= 1:
+        init_worker(*initargs)
+        yield from map(analyze, jobs)
+        return
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=initargs) as pool:
+        pending = collections.deque()
+        for job in jobs:
+            pending.append(pool.submit(analyze, job))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# Analyse every position from `stream` into the JSONL file `out`, skipping the ones a previous run finished
+def run(stream, out, depth=None, seconds=None, workers=None, weights=None, resume=True):
+    workers = os.cpu_count() if workers is None else workers
+    done = completed_records(out) if resume else 0
+    jobs = ((index, text, depth, seconds) for index, text in enumerate(read_positions(stream)) if index >= done)
+    start = time.perf_counter()
+    count = 0
+    with open(out, "a" if resume else "w") as f:
+        for record in ordered_results(jobs, workers, max(1, workers) * WINDOW_PER_WORKER, (weights,)):
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            count += 1
+    return {"skipped": done, "analysed": count, "seconds": time.perf_counter() - start}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyse Emberlord positions (one per line) into JSONL")
+    parser.add_argument("input", nargs="?", default="-", help="position file, '-' for stdin")
+    parser.add_argument("--out", default="analysis.jsonl")
+    parser.add_argument("--depth", type=int)
+    parser.add_argument("--seconds", type=float, help="time limit per position (default 1s without --depth)")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--weights", help="evaluation weights file (default: material count)")
+    parser.add_argument("--restart", action="store_true", help="overwrite --out instead of resuming it")
+    args = parser.parse_args(argv)
+
+    seconds = args.seconds if args.seconds is not None or args.depth else 1.0
+    stream = sys.stdin if args.input == "-" else open(args.input)
+    try:
+        stats = run(stream, args.out, args.depth, seconds, args.workers, args.weights, not args.restart)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    rate = stats["analysed"] / stats["seconds"] if stats["seconds"] else 0.0
+    print(f"skipped {stats['skipped']}, analysed {stats['analysed']} in {stats['seconds']:.1f}s "
+          f"({rate:.1f} positions/s) -> {args.out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+import argparse
+import json
+import os
+import random
+import time
+import logic
+
+# File names inside the autosave directory
+SNAPSHOT_FILE = "snapshot.json"
+JOURNAL_FILE = "journal.jsonl"
+# Journal records between compactions into a fresh snapshot
+COMPACT_EVERY = 64
+# Records are flushed to the OS immediately; fsync runs after this many records or seconds
+FSYNC_EVERY = 8
+FSYNC_SECONDS = 2.0
+# Seconds on a fresh turn clock
+TURN_SECONDS = 15
+
+
+# Game state as a JSON-ready dict (position, captures, draw-rule counters and repetition history)
+def game_state(game):
+    return {
+        "state": list(game.export_state()),
+        "history": game.history,
+        "progress": game.progress,
+        "last_burn_col": game.last_burn_col,
+    }
+
+
+# Rebuild a GameLogic from a game_state dict
+def load_game(data):
+    game = logic.GameLogic()
+    text, multi, red_captured, blue_captured, quiet_moves = data["state"]
+    game.load_state((text, tuple(multi) if multi else None, red_captured, blue_captured, quiet_moves))
+    game.history = list(data["history"])
+    game.repetitions = {}
+    for key in game.history:
+        game.repetitions[key] = game.repetitions.get(key, 0) + 1
+    game.progress = data["progress"]
+    game.last_burn_col = data["last_burn_col"]
+    return game
+
+
+# Write `data` as JSON to `path` atomically: temp file, fsync, rename, fsync the directory
+def write_atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class SavedGame:
+    # A game recovered from an autosave directory
+    def __init__(self, game, turn_time, profiles, seq, seconds):
+        self.game = game
+        self.turn_time = turn_time
+        self.profiles = profiles
+        self.seq = seq
+        self.seconds = seconds
+
+
+# Recover the saved game from `directory`: snapshot plus every newer journal record; None if nothing is saved
+def load(directory):
+    start = time.perf_counter()
+    snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+    if not os.path.exists(snapshot_path):
+        return None
+    with open(snapshot_path) as f:
+        snapshot = json.load(f)
+    game = load_game(snapshot["game"])
+    turn_time = snapshot["turn_time"]
+    profiles = snapshot["profiles"]
+    seq = snapshot["seq"]
+    journal_path = os.path.join(directory, JOURNAL_FILE)
+    if os.path.exists(journal_path):
+        with open(journal_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write from a crash; everything before it is intact
+                    break
+                # Records already folded into the snapshot (crash between compaction steps)
+                if record["seq"] <= seq:
+                    continue
+                seq = record["seq"]
+                if "move" in record:
+                    game.apply_move(logic.parse_move(record["move"]))
+                if "clock" in record:
+                    turn_time = record["clock"]
+                if "profiles" in record:
+                    profiles = record["profiles"]
+    return SavedGame(game, turn_time, profiles, seq, time.perf_counter() - start)
+
+
+class Journal:
+    # Append-only autosave: one line per action or clock change, compacted into an atomic snapshot
+    # `snapshot` returns {"game": game_state(...), "turn_time": int, "profiles": dict} for the live game
+    def __init__(self, directory, snapshot=None, seq=0):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.snapshot = snapshot
+        self.seq = seq
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.file = open(self.journal_path, "a")
+        self.since_compact = 0
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    # Append one record; it reaches the OS at once and the disk with the next fsync batch
+    def append(self, record):
+        self.seq += 1
+        record["seq"] = self.seq
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        self.unsynced += 1
+        self.since_compact += 1
+        if self.since_compact >= COMPACT_EVERY and self.snapshot is not None:
+            self.compact()
+        elif self.unsynced >= FSYNC_EVERY or time.monotonic() - self.last_sync >= FSYNC_SECONDS:
+            self.sync()
+
+    # Log a move, burn or timeout penalty (action tuple as taken by GameLogic.apply_move)
+    def record(self, move):
+        self.append({"move": logic.move_text(move)})
+
+    # Log the seconds left on the turn clock
+    def clock(self, seconds):
+        self.append({"clock": seconds})
+
+    # Log the player profiles ({color: {"name": ..., "img": path or None}})
+    def profiles(self, profiles):
+        self.append({"profiles": profiles})
+
+    # Force buffered records to disk
+    def sync(self):
+        if self.unsynced:
+            os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    # Replace the snapshot with the live state, then start an empty journal
+    def compact(self):
+        data = self.snapshot()
+        data["seq"] = self.seq
+        write_atomic(self.snapshot_path, data)
+        # A crash here leaves old records behind, but load() skips them by sequence number
+        self.file.close()
+        self.file = open(self.journal_path, "w")
+        self.since_compact = 0
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    # Forget the saved game (it finished or was abandoned)
+    def discard(self):
+        self.file.close()
+        for path in (self.snapshot_path, self.journal_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.file = open(self.journal_path, "a")
+        self.since_compact = 0
+        self.unsynced = 0
+
+    def close(self):
+        self.sync()
+        self.file.close()
+
+
+# Simulate a saved random game and time how long recovery takes
+def benchmark(directory, plies=200, seed=0):
+    rng = random.Random(seed)
+    game = logic.GameLogic()
+    game.reset_board()
+    profiles = {"red": {"name": "Red", "img": None}, "blue": {"name": "Blue", "img": None}}
+    clock = [TURN_SECONDS]
+    journal = Journal(directory, lambda: {"game": game_state(game), "turn_time": clock[0], "profiles": profiles})
+    journal.compact()
+    start = time.perf_counter()
+    played = 0
+    while played < plies and game.result() is None:
+        move = rng.choice(game.legal_moves())
+        game.apply_move(move)
+        journal.record(move)
+        clock[0] = rng.randint(1, TURN_SECONDS)
+        journal.clock(clock[0])
+        played += 1
+    journal.close()
+    write_seconds = time.perf_counter() - start
+    saved = load(directory)
+    assert saved.game.position_text() == game.position_text() and saved.turn_time == clock[0]
+    return {"plies": played, "write": write_seconds, "load": saved.seconds}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time Emberlord autosave journaling and recovery")
+    parser.add_argument("--dir", default="autosave-bench")
+    parser.add_argument("--plies", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    stats = benchmark(args.dir, args.plies, args.seed)
+    print(f"{stats['plies']} plies journaled in {stats['write'] * 1000:.1f}ms "
+          f"({stats['write'] / max(stats['plies'], 1) * 1e6:.0f}us/ply), restored in {stats['load'] * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import argparse
+import random
+import sys
+import logic
+import benchutil
+
+# Fixed positions in logic.GameLogic.position_text format
+POSITIONS = {
+    "opening": "blue:.r.r.r.r/r.r.r.r./.r.r.r.r/......../......../b.b.b.b./.b.b.b.b/b.b.b.b.",
+    "crowded_capture": "blue:.r.r.r.r/r.r.r.r./.r.r...r/....r.../...b..../b...b.b./.b.b.b.b/b.b.b.b.",
+    "midgame": "blue:.r.r.r.r/......../.r.r.b../r......./......../b...b.../...b.b.r/b...b...",
+    "flying_kings": "red:......../..R...../.....x../....b.../......../......y./.B....../........",
+    "burn_heavy": "blue:.r.r.R.r/r...r.../.r.....r/......../...b..../b...B.b./.b...b.b/b.b.....",
+}
+# Safety cap so two kings chasing each other cannot stall a benchmark
+MAX_PLIES = 300
+REPEAT = 30
+
+
+# Build a GameLogic set up at one of the corpus positions
+def load(name):
+    game = logic.GameLogic()
+    game.load_position(POSITIONS[name])
+    return game
+
+
+# Play one random legal step for the side to move; prefer a burn when `burn` is set
+def random_step(game, rng, burn=False):
+    if burn and game.multi_capture_piece is None:
+        kings = [p for p in game.pieces if p.color == game.current_turn and p.king and p.power_up]
+        if kings and game.burn_column(kings[0].col):
+            return True
+    if game.multi_capture_piece is not None:
+        pieces = [game.multi_capture_piece]
+    else:
+        pieces = [p for p in game.pieces if p.color == game.current_turn]
+    options = [(p.row, p.col, r, c) for p in pieces for r, c in game.get_valid_moves(p)]
+    rng.shuffle(options)
+    for option in options:
+        if game.move_piece(*option):
+            return True
+    return False
+
+
+# Play from `name` until someone wins or MAX_PLIES is reached
+def random_game(name, seed, burn=False):
+    return play_random(load(name), seed, burn)
+
+
+# Play random steps on `game` until someone wins or `plies` (default MAX_PLIES) is reached
+def play_random(game, seed, burn=False, plies=MAX_PLIES):
+    rng = random.Random(seed)
+    for _ in range(plies):
+        if game.winner_check() or not random_step(game, rng, burn):
+            break
+    return game
+
+
+# Starting position on a size x size board, optionally advanced by some random plies
+def sized_position(size, plies=0, seed=0):
+    game = logic.GameLogic(size)
+    game.reset_board()
+    return play_random(game, seed, plies=plies)
+
+
+# Move generation for every piece of the side to move
+def bench_movegen(game):
+    pieces = [p for p in game.pieces if p.color == game.current_turn]
+    return lambda: [game.get_valid_moves(p) for p in pieces]
+
+
+# Capture detection for both sides
+def bench_captures(game):
+    return lambda: (game.player_has_capture('red'), game.player_has_capture('blue'))
+
+
+def bench_winner(game):
+    return game.winner_check
+
+
+# Full move table for the side to move, built from scratch
+def bench_move_table(game):
+    return lambda: game.build_move_table(None)
+
+
+# Every benchmark as name -> (callable, inner loop count)
+def benchmarks():
+    result = {}
+    for name in POSITIONS:
+        result[f"movegen/{name}"] = (bench_movegen(load(name)), 200)
+        result[f"captures/{name}"] = (bench_captures(load(name)), 200)
+        result[f"winner_check/{name}"] = (bench_winner(load(name)), 200)
+    result["games/random"] = (lambda: [random_game("opening", seed) for seed in range(5)], 1)
+    result["games/burn_heavy"] = (lambda: [random_game(name, seed, burn=True)
+                                          for name in ("burn_heavy", "midgame") for seed in range(5)], 1)
+    # The same work on every board size, to check move generation scales with the piece count
+    for size in logic.BOARD_SIZES:
+        opening = sized_position(size)
+        midgame = sized_position(size, plies=4 * size)
+        result[f"size{size}/movegen_opening"] = (bench_movegen(opening), 200)
+        result[f"size{size}/movegen_midgame"] = (bench_movegen(midgame), 200)
+        result[f"size{size}/captures_midgame"] = (bench_captures(midgame), 200)
+        result[f"size{size}/move_table_midgame"] = (bench_move_table(midgame), 200)
+        result[f"size{size}/games_random"] = (lambda size=size: [play_random(sized_position(size), seed)
+                                                                 for seed in range(5)], 1)
+    return result
+
+
+# Pieces on the board a size benchmark runs on
+def size_pieces(size, bench):
+    plies = 0 if bench.endswith("opening") else 4 * size
+    return len(sized_position(size, plies=plies).pieces)
+
+
+# Per-piece cost of each size benchmark relative to 8x8: near 1.0 means generation grows with the piece count only
+def size_scaling(results):
+    lines = []
+    for name, r in results.items():
+        if not name.startswith("size") or name.endswith("games_random"):
+            continue
+        size, bench = name[4:].split("/")
+        base = results.get(f"size{logic.DEFAULT_SIZE}/{bench}")
+        if base is None:
+            continue
+        base_pieces = size_pieces(logic.DEFAULT_SIZE, bench)
+        pieces = size_pieces(int(size), bench)
+        ratio = r["p50_ms"] / base["p50_ms"]
+        lines.append(f"{name:<32} x{ratio:5.2f} time, x{pieces / base_pieces:5.2f} pieces, "
+                     f"x{ratio * base_pieces / pieces:5.2f} per piece")
+    return lines
+
+
+# Time every benchmark whose name starts with one of `prefixes`; figures are per inner call
+def run(prefixes=(), repeat=REPEAT):
+    results = {}
+    for name, (func, inner) in benchmarks().items():
+        if prefixes and not name.startswith(tuple(prefixes)):
+            continue
+
+        def batch():
+            for _ in range(inner):
+                func()
+        samples = [s / inner for s in benchutil.time_calls(batch, repeat)]
+        results[name] = benchutil.summarize(samples)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GameLogic microbenchmarks with baseline gating")
+    parser.add_argument("only", nargs="*", help="run benchmarks whose name starts with these prefixes")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--baseline", help="JSON baseline to compare against")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown, 0.15 = 15%%")
+    args = parser.parse_args(argv)
+    if args.save and not args.baseline:
+        parser.error("--save needs --baseline")
+
+    results = run(args.only, args.repeat)
+    for name, r in results.items():
+        print(f"{name:<32} p50={r['p50_ms'] * 1e3:10.2f}us p90={r['p90_ms'] * 1e3:10.2f}us "
+              f"{1e3 / r['p50_ms']:12.0f}/s")
+    for line in size_scaling(results):
+        print(line)
+
+    if args.baseline and args.save:
+        benchutil.save_baseline(args.baseline, results)
+        return 0
+    regressions = benchutil.compare(results, benchutil.load_baseline(args.baseline), args.threshold)
+    for line in regressions:
+        print("REGRESSION", line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+# Render without a display; must be set before QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# ui.py loads its images from paths relative to this folder
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+from PyQt6.QtWidgets import QApplication
+import ui
+import logic
+import multiboard
+import profiling
+import benchutil
+
+FRAMES = 300
+WARMUP = 20
+REPEAT = 5
+
+
+# Idle board in the opening position: nothing changes between frames
+def scenario_idle(size=ui.BOARD_SIZE):
+    board = ui.Board(size=size)
+    board.show()
+    return board, lambda i: None
+
+
+# Short opening that leaves blue with a forced capture, flashing as it does in play
+def scenario_forced_capture():
+    board = ui.Board()
+    board.show()
+    board.logic.move_piece(5, 2, 4, 3)
+    board.logic.move_piece(2, 5, 3, 4)
+    board.timer_active = True
+    board.update_turn_timer()
+
+    def step(i):
+        if i % 30 == 0:
+            board.forced_flash_state = not board.forced_flash_state
+    return board, step
+
+
+# King burns a column; frames walk through the lava animation
+def scenario_column_burn():
+    board = ui.Board()
+    board.show()
+    board.logic.promote_piece(board.logic.get_piece(5, 0))
+    board.prepare_burn("blue")
+
+    frames, delay = board.assets.frames(ui.LAVA_ANIMATION)
+
+    def step(i):
+        board.burn_started = board.clock.now() - i * delay % (len(frames) * delay)
+    return board, step
+
+
+# Menu-to-play blur transition, stepping the blur animation by hand
+def scenario_menu_blur():
+    window = ui.EmberLord()
+    window.transition_to("play")
+    window.blur_anim.pause()
+    duration = window.blur_anim.duration()
+
+    def step(i):
+        window.blur_anim.setCurrentTime(i * 7 % duration)
+    return window, step
+
+
+# `count` live games in one multi-board window; one random move per frame, rows past the window stay offscreen
+def scenario_multi_board(count):
+    view = multiboard.MultiBoardView()
+    for _ in range(count):
+        view.add_board()
+    view.resize(1024, ui.WINDOW_SIZE)
+    view.show()
+    rng = random.Random(0)
+
+    def step(i):
+        board = view.boards[i % count]
+        moves = board.logic.legal_moves()
+        if board.logic.result() is not None or not moves:
+            game = logic.GameLogic()
+            game.reset_board()
+            board.set_game(game)
+        else:
+            board.play(rng.choice(moves))
+        view.clock.tick()
+    return view, step
+
+
+SCENARIOS = {
+    "idle": scenario_idle,
+    "idle_10x10": lambda: scenario_idle(10),
+    "idle_12x12": lambda: scenario_idle(12),
+    "forced_capture": scenario_forced_capture,
+    "column_burn": scenario_column_burn,
+    "menu_blur": scenario_menu_blur,
+    "multi_board_4": lambda: scenario_multi_board(4),
+    "multi_board_16": lambda: scenario_multi_board(16),
+}
+
+
+# Render `frames` synchronous repaints of one scenario and collect frame, paint and CPU figures
+def run_scenario(app, profiler, factory, frames, warmup):
+    widget, step = factory()
+    app.processEvents()
+    for i in range(warmup):
+        step(i)
+        widget.repaint()
+    profiler.clear()
+    samples = []
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for i in range(frames):
+        step(i)
+        start = time.perf_counter()
+        widget.repaint()
+        samples.append(time.perf_counter() - start)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    result = benchutil.summarize(samples)
+    paints = [d / 1e9 for d in profiler.durations("Board.paintEvent")]
+    if paints:
+        paint = benchutil.summarize(paints)
+        result.update({f"paint_{key}": value for key, value in paint.items() if key != "n"})
+    result["cpu_ms_per_frame"] = cpu / frames * 1e3
+    result["cpu_util"] = cpu / wall if wall else 0.0
+    widget.close()
+    widget.deleteLater()
+    app.processEvents()
+    return result
+
+
+# Run each scenario `repeat` times and keep the median of every metric
+def run(names, frames=FRAMES, warmup=WARMUP, repeat=REPEAT):
+    app = QApplication.instance() or QApplication(sys.argv)
+    profiler = profiling.Profiler().install(ui.Board)
+    results = {}
+    try:
+        for name in names:
+            runs = [run_scenario(app, profiler, SCENARIOS[name], frames, warmup) for _ in range(repeat)]
+            results[name] = {key: statistics.median(r[key] for r in runs) for key in runs[0]}
+    finally:
+        profiler.uninstall()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offscreen frame-time benchmark for the Emberlord UI")
+    parser.add_argument("scenarios", nargs="*", help="subset of: " + ", ".join(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--baseline", help="JSON baseline to compare against")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error("unknown scenario: " + ", ".join(unknown))
+    if args.save and not args.baseline:
+        parser.error("--save needs --baseline")
+
+    results = run(args.scenarios or list(SCENARIOS), args.frames, WARMUP, args.repeat)
+    for name, r in results.items():
+        paint = f" paint p50={r['paint_p50_ms']:.3f}ms p99={r['paint_p99_ms']:.3f}ms" if "paint_p50_ms" in r else ""
+        print(f"{name:<16} frame p50={r['p50_ms']:.3f}ms p90={r['p90_ms']:.3f}ms p99={r['p99_ms']:.3f}ms"
+              f"{paint} cpu={r['cpu_ms_per_frame']:.3f}ms/frame ({r['cpu_util'] * 100:.0f}%)")
+
+    if args.baseline and args.save:
+        benchutil.save_baseline(args.baseline, results)
+        return 0
+    regressions = benchutil.compare(results, benchutil.load_baseline(args.baseline), args.threshold)
+    for line in regressions:
+        print("REGRESSION", line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
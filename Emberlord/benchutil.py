@@ -0,0 +1,64 @@
+import json
+import os
+import statistics
+import time
+
+
+# Return the `q`-th percentile (0-100) of a list of numbers
+def percentile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+# Time `func` `repeat` times after `warmup` unmeasured calls; returns seconds per call
+def time_calls(func, repeat, warmup=3):
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+# Summarise raw samples (seconds) as milliseconds percentiles
+def summarize(samples):
+    return {
+        "n": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1e3,
+        "p50_ms": percentile(samples, 50) * 1e3,
+        "p90_ms": percentile(samples, 90) * 1e3,
+        "p99_ms": percentile(samples, 99) * 1e3,
+        "max_ms": max(samples) * 1e3,
+    }
+
+
+# Load a stored baseline; a missing file means there is nothing to compare against
+def load_baseline(path):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+# Write results as the new baseline
+def save_baseline(path, results):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+# Compare `metric` of every benchmark against the baseline; returns a list of regression messages
+def compare(results, baseline, threshold, metric="p50_ms"):
+    regressions = []
+    for name, result in sorted(results.items()):
+        old = baseline.get(name)
+        if not old or not old.get(metric):
+            continue
+        ratio = result[metric] / old[metric]
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {metric} {old[metric]:.3f} -> {result[metric]:.3f} (+{(ratio - 1) * 100:.1f}%)")
+    return regressions
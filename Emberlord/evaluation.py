@@ -0,0 +1,224 @@
+import argparse
+import json
+import random
+import time
+import logic
+
+# Feature vector, every term counted as red minus blue
+FEATURES = ("men", "kings", "burns", "advancement", "back_rank", "safe_kings", "burn_threat")
+DEFAULT_WEIGHTS = {
+    "men": 100.0,
+    "kings": 250.0,
+    "burns": 60.0,
+    "advancement": 4.0,
+    "back_rank": 8.0,
+    "safe_kings": 15.0,
+    "burn_threat": 30.0,
+}
+# Number of features that are plain sums over pieces (burn_threat is derived from column counts)
+PIECE_FEATURES = len(FEATURES) - 1
+
+
+# Contribution of one piece (position text symbol at row,col) to the per-piece features, red positive
+def piece_terms(char, row, col, size=logic.DEFAULT_SIZE):
+    color, king, power_up = logic.CHAR_PIECES[char]
+    sign = 1 if color == 'red' else -1
+    last = size - 1
+    if king:
+        on_edge = row in (0, last) or col in (0, last)
+        return (0, sign, sign * power_up, 0, 0, sign * on_edge)
+    advanced = row if color == 'red' else last - row
+    back_rank = row == (0 if color == 'red' else last)
+    return (sign, 0, 0, sign * advanced, sign * back_rank, 0)
+
+
+# piece_terms for every (char, row, col) of each board size
+PIECE_TERMS = {size: {(char, r, c): piece_terms(char, r, c, size)
+                      for char in logic.CHAR_PIECES for r in range(size) for c in range(size)}
+               for size in logic.BOARD_SIZES}
+
+
+# Read weights from a JSON file: {"weights": {feature: value, ...}}; missing features keep their default
+def load_weights(path):
+    with open(path) as f:
+        data = json.load(f)
+    weights = dict(DEFAULT_WEIGHTS)
+    weights.update(data.get("weights", data))
+    unknown = set(weights) - set(FEATURES)
+    if unknown:
+        raise ValueError(f"unknown features in {path}: {', '.join(sorted(unknown))}")
+    return weights
+
+
+# Write weights in the format load_weights reads
+def save_weights(path, weights):
+    with open(path, "w") as f:
+        json.dump({"weights": weights}, f, indent=2)
+
+
+# Feature vector recomputed from the whole board (reference for the incremental accumulators)
+def scratch_features(game):
+    evaluator = Evaluator()
+    evaluator.size = game.size
+    evaluator.clear()
+    for p in game.pieces:
+        evaluator.add(logic.PIECE_CHARS[(p.color, p.king, p.power_up)], p.row, p.col)
+    return evaluator.features()
+
+
+class Evaluator:
+    # Evaluation with feature accumulators kept up to date by GameLogic's piece events (make and unmake)
+    def __init__(self, weights=None):
+        weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+        self.weights = [float(weights[name]) for name in FEATURES]
+        self.game = None
+        self.size = logic.DEFAULT_SIZE
+        self.clear()
+
+    # Build an Evaluator from a weights file
+    @classmethod
+    def from_file(cls, path):
+        return cls(load_weights(path))
+
+    # Listener hook: forget every piece
+    def clear(self):
+        # The attached game may have been loaded with another board size
+        if self.game is not None:
+            self.size = self.game.size
+        self.terms = PIECE_TERMS[self.size]
+        self.acc = [0] * PIECE_FEATURES
+        self.columns = {'red': [0] * self.size, 'blue': [0] * self.size}
+        self.burners = {'red': 0, 'blue': 0}
+
+    # Listener hook: a piece `char` appeared on (row,col)
+    def add(self, char, row, col):
+        acc = self.acc
+        for i, term in enumerate(self.terms[(char, row, col)]):
+            acc[i] += term
+        color, king, power_up = logic.CHAR_PIECES[char]
+        self.columns[color][col] += 1
+        if power_up:
+            self.burners[color] += 1
+
+    # Listener hook: a piece `char` left (row,col)
+    def remove(self, char, row, col):
+        acc = self.acc
+        for i, term in enumerate(self.terms[(char, row, col)]):
+            acc[i] -= term
+        color, king, power_up = logic.CHAR_PIECES[char]
+        self.columns[color][col] -= 1
+        if power_up:
+            self.burners[color] -= 1
+
+    # Follow `game` from now on; the accumulators are rebuilt once from its pieces
+    def attach(self, game):
+        if self.game is not None and self.game is not game and self.game.listener is self:
+            self.game.listener = None
+        self.game = game
+        game.listener = self
+        self.clear()
+        for p in game.pieces:
+            self.add(logic.PIECE_CHARS[(p.color, p.king, p.power_up)], p.row, p.col)
+
+    # Current feature vector (red minus blue) of the attached game
+    def features(self):
+        threat = 0
+        if self.burners['red']:
+            threat += max(self.columns['blue'])
+        if self.burners['blue']:
+            threat -= max(self.columns['red'])
+        return self.acc + [threat]
+
+    # Score for the side to move; usable as search.Searcher(evaluate=...)
+    def __call__(self, game):
+        if game is not self.game:
+            self.attach(game)
+        score = sum(w * f for w, f in zip(self.weights, self.features()))
+        return score if game.current_turn == 'red' else -score
+
+    # Score many feature vectors at once; `red_to_move` flags flip the sign for blue to move
+    def score_batch(self, features, red_to_move):
+        import numpy as np
+        scores = np.asarray(features, dtype=np.float64) @ np.asarray(self.weights, dtype=np.float64)
+        return np.where(np.asarray(red_to_move, dtype=bool), scores, -scores)
+
+
+class LeafBatch:
+    # Collects leaf feature vectors during a search and scores them together
+    def __init__(self, evaluator):
+        self.evaluator = evaluator
+        self.features = []
+        self.red_to_move = []
+
+    # Queue the attached game's current position; returns its index in the batch
+    def add(self, game):
+        if game is not self.evaluator.game:
+            self.evaluator.attach(game)
+        self.features.append(self.evaluator.features())
+        self.red_to_move.append(game.current_turn == 'red')
+        return len(self.features) - 1
+
+    # Scores for every queued position (side-to-move point of view), then empty the batch
+    def score(self):
+        scores = self.evaluator.score_batch(self.features, self.red_to_move)
+        self.features = []
+        self.red_to_move = []
+        return scores
+
+
+# Time single incremental scoring against from-scratch recomputation and batched scoring on random leaves
+def benchmark(leaves=20000, seed=0, batch=1024):
+    rng = random.Random(seed)
+    game = logic.GameLogic()
+    game.reset_board()
+    evaluator = Evaluator()
+    evaluator.attach(game)
+    start_mark = game.checkpoint()
+    incremental = scratch = 0.0
+    batcher = LeafBatch(evaluator)
+    batched = 0.0
+    for _ in range(leaves):
+        moves = game.legal_moves()
+        if not moves or game.result() is not None:
+            game.rollback(start_mark)
+            continue
+        mark = game.checkpoint()
+        game.apply_move(rng.choice(moves))
+        t = time.perf_counter()
+        evaluator(game)
+        incremental += time.perf_counter() - t
+        t = time.perf_counter()
+        scratch_features(game)
+        scratch += time.perf_counter() - t
+        t = time.perf_counter()
+        batcher.add(game)
+        if len(batcher.features) == batch:
+            batcher.score()
+        batched += time.perf_counter() - t
+        if rng.random() < 0.3:
+            game.rollback(mark)
+    if batcher.features:
+        t = time.perf_counter()
+        batcher.score()
+        batched += time.perf_counter() - t
+    return {"leaves": leaves, "incremental": incremental, "scratch": scratch, "batched": batched}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Emberlord evaluation function")
+    parser.add_argument("--leaves", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--write-weights", metavar="PATH", help="write the default weights file and exit")
+    args = parser.parse_args(argv)
+
+    if args.write_weights:
+        save_weights(args.write_weights, DEFAULT_WEIGHTS)
+        return
+    stats = benchmark(args.leaves, args.seed, args.batch)
+    for name in ("incremental", "scratch", "batched"):
+        print(f"{name:<12} {stats[name] / stats['leaves'] * 1e6:.2f}us/leaf")
+
+
+if __name__ == "__main__":
+    main()
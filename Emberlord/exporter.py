@@ -0,0 +1,115 @@
+import argparse
+import os
+import numpy as np
+import logic
+import results
+import selfplay
+
+# Planes per position: red men, blue men, red kings, blue kings, kings holding their burn, side to move
+PLANES = 6
+RED_MEN, BLUE_MEN, RED_KINGS, BLUE_KINGS, POWER_UP, SIDE_TO_MOVE = range(PLANES)
+# Final result from red's point of view
+RESULT_VALUES = {'red': 1, 'blue': -1, 'draw': 0}
+CHUNK_SIZE = 65536
+
+
+# Write the position of `game` into `planes` (PLANES x size x size, already zeroed)
+def encode(game, planes):
+    for p in game.pieces:
+        if p.king:
+            planes[RED_KINGS if p.color == 'red' else BLUE_KINGS, p.row, p.col] = 1
+            if p.power_up:
+                planes[POWER_UP, p.row, p.col] = 1
+        else:
+            planes[RED_MEN if p.color == 'red' else BLUE_MEN, p.row, p.col] = 1
+    if game.current_turn == 'red':
+        planes[SIDE_TO_MOVE] = 1
+
+
+# Replay a stored game and yield (game, result) at the start of every turn
+def record_positions(record):
+    game = results.record_game(record)
+    result = RESULT_VALUES[record["result"]]
+    yield game, result
+    for move in results.record_moves(record):
+        if not game.apply_move(move):
+            break
+        if game.multi_capture_piece is None:
+            yield game, result
+
+
+# Pack positions of one board size into fixed-size chunks:
+# {"planes": (n, PLANES, size, size) uint8, "side": (n,) int8, "result": (n,) int8}
+# The buffers are reused, so each chunk must be written out before the next one is requested
+def chunks(positions, chunk_size=CHUNK_SIZE, size=logic.DEFAULT_SIZE):
+    planes = np.zeros((chunk_size, PLANES, size, size), dtype=np.uint8)
+    side = np.zeros(chunk_size, dtype=np.int8)
+    result = np.zeros(chunk_size, dtype=np.int8)
+    n = 0
+    for game, outcome in positions:
+        encode(game, planes[n])
+        side[n] = 1 if game.current_turn == 'red' else -1
+        result[n] = outcome
+        n += 1
+        if n == chunk_size:
+            yield {"planes": planes, "side": side, "result": result}
+            planes[:] = 0
+            n = 0
+    if n:
+        yield {"planes": planes[:n], "side": side[:n], "result": result[:n]}
+
+
+# Write chunks as numbered shards; 'npz' is compressed, 'npy' gives one memory-mappable file per array
+def write_shards(chunk_iter, out_dir, fmt="npz"):
+    os.makedirs(out_dir, exist_ok=True)
+    total = 0
+    for index, chunk in enumerate(chunk_iter):
+        stem = os.path.join(out_dir, f"shard_{index:05d}")
+        if fmt == "npz":
+            np.savez_compressed(stem + ".npz", **chunk)
+        else:
+            for name, array in chunk.items():
+                np.save(f"{stem}_{name}.npy", array)
+        total += len(chunk["result"])
+    return total
+
+
+# Positions from every game of one board size in a results database
+def database_positions(path, size=logic.DEFAULT_SIZE):
+    store = results.ResultsStore(path)
+    try:
+        for record in store.games("size = ?", (size,)):
+            yield from record_positions(record)
+    finally:
+        store.close()
+
+
+# Positions from freshly simulated self-play games
+def selfplay_positions(games, workers=None, seed=0, red="random", blue="random", size=logic.DEFAULT_SIZE):
+    for record in selfplay.generate(games, workers, seed, red, blue, size=size):
+        yield from record_positions(record)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export Emberlord positions and outcomes as NumPy shards")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--db", help="results database to export")
+    source.add_argument("--selfplay", type=int, metavar="GAMES", help="simulate this many games instead")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--out", default="dataset")
+    parser.add_argument("--format", choices=("npz", "npy"), default="npz")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--size", type=int, choices=logic.BOARD_SIZES, default=logic.DEFAULT_SIZE,
+                        help="board size to export; shards hold one size")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        positions = database_positions(args.db, args.size)
+    else:
+        positions = selfplay_positions(args.selfplay, args.workers, size=args.size)
+    total = write_shards(chunks(positions, args.chunk, args.size), args.out, args.format)
+    print(f"wrote {total} positions to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
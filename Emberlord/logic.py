@@ -1,5 +1,63 @@
+import random
 import time
 
+# Position text symbols: men, kings still holding their burn, kings that already burned
+PIECE_CHARS = {
+    ('red', False, False): 'r', ('red', True, True): 'R', ('red', True, False): 'x',
+    ('blue', False, False): 'b', ('blue', True, True): 'B', ('blue', True, False): 'y',
+}
+CHAR_PIECES = {char: state for state, char in PIECE_CHARS.items()}
+
+# Supported boards (squares per side); 8 is the classic game
+BOARD_SIZES = (8, 10, 12)
+DEFAULT_SIZE = 8
+# Diagonal directions, in the order moves are generated
+DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# Zobrist keys for position hashing; fixed seed so hashes are stable between runs and processes
+_zobrist_rng = random.Random(0x3E4B)
+ZOBRIST = {(r, c, char): _zobrist_rng.getrandbits(64)
+           for r in range(8) for c in range(8) for char in CHAR_PIECES}
+RED_TO_MOVE_KEY = _zobrist_rng.getrandbits(64)
+# Keys for the squares only the larger boards have, drawn afterwards so 8x8 hashes stay unchanged
+for _r in range(max(BOARD_SIZES)):
+    for _c in range(max(BOARD_SIZES)):
+        for _char in CHAR_PIECES:
+            if (_r, _c, _char) not in ZOBRIST:
+                ZOBRIST[(_r, _c, _char)] = _zobrist_rng.getrandbits(64)
+# The larger boards share the 8x8 square keys, so each size folds in its own key (8x8 keeps 0)
+SIZE_KEYS = {size: 0 if size == DEFAULT_SIZE else _zobrist_rng.getrandbits(64) for size in BOARD_SIZES}
+
+# Turns in a row without a capture or promotion before the game is drawn
+QUIET_MOVE_LIMIT = 50
+# Times the same position (and side to move) may occur before the game is drawn
+REPETITION_LIMIT = 3
+# Move tables kept per game; searches revisit parent positions after every rollback
+MOVE_TABLE_CACHE = 4096
+
+# Render a move tuple as text: "5,2-4,3", "burn 3" or "timeout 5,2"
+def move_text(move):
+    if move[0] == 'burn':
+        return f"burn {move[1]}"
+    if move[0] == 'timeout':
+        return f"timeout {move[1]},{move[2]}"
+    return f"{move[1]},{move[2]}-{move[3]},{move[4]}"
+
+
+# Parse text produced by move_text back into a move tuple
+def parse_move(text):
+    text = text.strip()
+    if text.startswith('burn '):
+        return ('burn', int(text[5:]))
+    if text.startswith('timeout '):
+        row, col = text[8:].split(',')
+        return ('timeout', int(row), int(col))
+    start, end = text.split('-')
+    sr, sc = start.split(',')
+    er, ec = end.split(',')
+    return ('move', int(sr), int(sc), int(er), int(ec))
+
+
 class Piece:
     # Simple game piece model: stores position, color and king/power-up state
     def __init__(self, row, col, color):
@@ -15,43 +73,330 @@ class Piece:
         self.power_up = True
 
 
+class BoardGeometry:
+    # Per-size square tables so move generation never does bounds arithmetic:
+    #   rays[sq]    -> one tuple of squares per direction, nearest first (empty directions left out)
+    #   steps[sq]   -> (row_step, neighbour, square beyond the neighbour or None) per direction
+    #   jumps[sq]   -> (jumped square, landing square) for every on-board two-step jump
+    #   forward[color][sq] -> squares a man of `color` can step to
+    def __init__(self, size):
+        self.size = size
+        # Rows of men each side starts with: 3 on 8x8, 4 on 10x10, 5 on 12x12
+        self.men_rows = (size - 2) // 2
+        self.rays = {}
+        self.steps = {}
+        self.jumps = {}
+        self.forward = {'red': {}, 'blue': {}}
+        for r in range(size):
+            for c in range(size):
+                rays, steps, jumps = [], [], []
+                for dr, dc in DIRECTIONS:
+                    ray = []
+                    rr, cc = r + dr, c + dc
+                    while 0 <= rr < size and 0 <= cc < size:
+                        ray.append((rr, cc))
+                        rr += dr
+                        cc += dc
+                    if ray:
+                        rays.append(tuple(ray))
+                        steps.append((dr, ray[0], ray[1] if len(ray) > 1 else None))
+                for dr, dc in ((-2, -2), (-2, 2), (2, -2), (2, 2)):
+                    if 0 <= r + dr < size and 0 <= c + dc < size:
+                        jumps.append(((r + dr // 2, c + dc // 2), (r + dr, c + dc)))
+                self.rays[(r, c)] = tuple(rays)
+                self.steps[(r, c)] = tuple(steps)
+                self.jumps[(r, c)] = tuple(jumps)
+                for color, dr in (('red', 1), ('blue', -1)):
+                    self.forward[color][(r, c)] = tuple((r + dr, c + dc) for dc in (-1, 1)
+                                                        if 0 <= r + dr < size and 0 <= c + dc < size)
+
+
+# One shared BoardGeometry per size, built on first use
+_geometries = {}
+
+
+# Return the BoardGeometry for a size in BOARD_SIZES
+def board_geometry(size):
+    if size not in BOARD_SIZES:
+        raise ValueError(f"unsupported board size {size}; choose from {', '.join(map(str, BOARD_SIZES))}")
+    geometry = _geometries.get(size)
+    if geometry is None:
+        geometry = _geometries[size] = BoardGeometry(size)
+    return geometry
+
+
+class MoveTable:
+    # Legal moves for one turn: {(row,col): {(end_row,end_col): jumped square or None}},
+    # whether a capture is forced, which pieces can capture and which columns can be burned
+    def __init__(self, key, moves, must_capture, capture_squares, burn_cols):
+        self.key = key
+        self.moves = moves
+        self.must_capture = must_capture
+        self.capture_squares = capture_squares
+        self.burn_cols = burn_cols
+
+
 class GameLogic:
     # Core game rules and state: pieces, turns, capture tracking
-    # Initialize game state and counters
-    def __init__(self):
+    # Initialize game state and counters for a size x size board
+    def __init__(self, size=DEFAULT_SIZE):
+        self.size = size
+        self.geometry = board_geometry(size)
         self.pieces = []
+        self.squares = {}
+        self.counts = {'red': 0, 'blue': 0}
+        self.mobile_piece = {'red': None, 'blue': None}
         self.current_turn = 'blue'
         self.start_time = None
         self.elapsed = 0
         self.red_captured = 0
         self.blue_captured = 0
         self.must_continue_capture_piece = None
+        self.must_continue_capture = None
         self.last_burn_col = None
         self.multi_capture_piece = None
+        # Position hash, repetition history and undo log
+        self.board_hash = 0
+        self.history = []
+        self.repetitions = {}
+        self.quiet_moves = 0
+        self.progress = False
+        self.undo_log = []
+        self.recording = True
+        self.quiet_move_limit = QUIET_MOVE_LIMIT
+        self.move_tables = {}
+        # Optional observer told about every piece added/removed (see evaluation.Evaluator)
+        self.listener = None
+
+    # Switch to another board size; the board itself is left for reset_board/load_position to fill
+    def set_size(self, size):
+        if size != self.size:
+            self.geometry = board_geometry(size)
+            self.size = size
+            self.move_tables.clear()
+
     # Reset the board to the initial starting position and clear counters
     def reset_board(self):
         self.red_captured = 0
         self.blue_captured = 0
-        self.pieces.clear()
-        for row in range(3):
-            for col in range(8):
+        self.clear_pieces()
+        size = self.size
+        men_rows = self.geometry.men_rows
+        for row in range(men_rows):
+            for col in range(size):
                 if (row + col) % 2 != 0:
-                    self.pieces.append(Piece(row, col, 'red'))
-        for row in range(5, 8):
-            for col in range(8):
+                    self.add_piece(Piece(row, col, 'red'))
+        for row in range(size - men_rows, size):
+            for col in range(size):
                 if (row + col) % 2 != 0:
-                    self.pieces.append(Piece(row, col, 'blue'))
+                    self.add_piece(Piece(row, col, 'blue'))
         self.current_turn = 'blue'
         self.start_time = None
         self.elapsed = 0
         self.must_continue_capture = None
+        self.start_history()
+
+    # Describe the position as text: "<turn>:<row0>/<row1>/..." using PIECE_CHARS, '.' for empty
+    def position_text(self):
+        rows = [['.'] * self.size for _ in range(self.size)]
+        for p in self.pieces:
+            rows[p.row][p.col] = PIECE_CHARS[(p.color, p.king, p.power_up)]
+        return self.current_turn + ':' + '/'.join(''.join(row) for row in rows)
+
+    # Set up the board from position text produced by position_text (counters are cleared);
+    # the number of rows picks the board size
+    def load_position(self, text):
+        if text.count(':') != 1:
+            raise ValueError("position must be '<red|blue>:<row>/<row>/...' with one character per square")
+        turn, board = text.strip().split(':')
+        if turn not in ('red', 'blue'):
+            raise ValueError(f"bad side to move: {turn!r}")
+        rows = board.split('/')
+        if len(rows) not in BOARD_SIZES or any(len(row) != len(rows) for row in rows):
+            raise ValueError("position needs 8, 10 or 12 rows of as many squares")
+        self.set_size(len(rows))
+        self.red_captured = 0
+        self.blue_captured = 0
+        self.start_time = None
+        self.elapsed = 0
+        self.must_continue_capture = None
+        self.clear_pieces()
+        for r, row in enumerate(rows):
+            for c, char in enumerate(row):
+                if char == '.':
+                    continue
+                if char not in CHAR_PIECES:
+                    raise ValueError(f"unknown piece {char!r}")
+                color, king, power_up = CHAR_PIECES[char]
+                piece = Piece(r, c, color)
+                piece.king = king
+                piece.power_up = power_up
+                self.add_piece(piece)
+        self.current_turn = turn
+        self.multi_capture_piece = None
+        self.last_burn_col = None
+        self.start_history()
+
+    # Hash of the board size, piece placement and side to move
+    def position_hash(self):
+        key = self.board_hash ^ SIZE_KEYS[self.size]
+        if self.current_turn == 'red':
+            return key ^ RED_TO_MOVE_KEY
+        return key
+
+    # Hash plus the square of a piece that is still mid-capture; identifies a search node
+    def position_key(self):
+        multi = self.multi_capture_piece
+        return self.position_hash(), (multi.row, multi.col) if multi else None
+
+    # Forget earlier positions and the undo log; the current position is the first in history
+    def start_history(self):
+        key = self.position_hash()
+        self.history = [key]
+        self.repetitions = {key: 1}
+        self.quiet_moves = 0
+        self.progress = False
+        self.undo_log = []
+
+    # Add the position reached at the start of a turn to the repetition history
+    def record_position(self):
+        if self.progress:
+            self.quiet_moves = 0
+        else:
+            self.quiet_moves += 1
+        self.progress = False
+        key = self.position_hash()
+        self.history.append(key)
+        self.repetitions[key] = self.repetitions.get(key, 0) + 1
+
+    # Snapshot the scalar state so everything after it can be rolled back
+    def checkpoint(self):
+        return (len(self.undo_log), len(self.history), self.current_turn, self.red_captured, self.blue_captured,
+                self.multi_capture_piece, self.must_continue_capture, self.last_burn_col, self.quiet_moves,
+                self.progress)
+
+    # Undo every board change made since `mark` was taken with checkpoint()
+    def rollback(self, mark):
+        log_len, history_len = mark[0], mark[1]
+        self.recording = False
+        while len(self.undo_log) > log_len:
+            op = self.undo_log.pop()
+            if op[0] == 'add':
+                self.remove_piece(op[1])
+            elif op[0] == 'remove':
+                self.add_piece(op[1], op[2])
+            elif op[0] == 'move':
+                self.relocate_piece(op[1], op[2], op[3])
+            else:
+                self.set_king_state(op[1], op[2], op[3])
+        self.recording = True
+        while len(self.history) > history_len:
+            key = self.history.pop()
+            self.repetitions[key] -= 1
+            if not self.repetitions[key]:
+                del self.repetitions[key]
+        (self.current_turn, self.red_captured, self.blue_captured, self.multi_capture_piece,
+         self.must_continue_capture, self.last_burn_col, self.quiet_moves, self.progress) = mark[2:]
+    # Compact picklable state: position text, multi-capture square, capture counters and draw counters
+    def export_state(self):
+        multi = self.multi_capture_piece
+        return (self.position_text(), (multi.row, multi.col) if multi else None,
+                self.red_captured, self.blue_captured, self.quiet_moves)
+
+    # Restore a state produced by export_state (repetition history starts afresh)
+    def load_state(self, state):
+        text, multi, self.red_captured, self.blue_captured, quiet_moves = state
+        captured = (self.red_captured, self.blue_captured)
+        self.load_position(text)
+        self.red_captured, self.blue_captured = captured
+        self.quiet_moves = quiet_moves
+        if multi is not None:
+            self.multi_capture_piece = self.get_piece(*multi)
+
+    # Return an independent GameLogic in the same position
+    def copy(self):
+        game = GameLogic(self.size)
+        game.load_state(self.export_state())
+        game.quiet_move_limit = self.quiet_move_limit
+        game.history = list(self.history)
+        game.repetitions = dict(self.repetitions)
+        return game
+
+    # Remove every piece and reset the square index and piece counts
+    def clear_pieces(self):
+        self.pieces.clear()
+        self.squares.clear()
+        self.counts = {'red': 0, 'blue': 0}
+        self.mobile_piece = {'red': None, 'blue': None}
+        self.board_hash = 0
+        self.undo_log = []
+        if self.listener is not None:
+            self.listener.clear()
+
+    # Put a piece on the board (at list position `index` if given), keeping index, counts and hash in step
+    def add_piece(self, piece, index=None):
+        if index is None:
+            self.pieces.append(piece)
+        else:
+            self.pieces.insert(index, piece)
+        self.squares[(piece.row, piece.col)] = piece
+        self.counts[piece.color] += 1
+        char = PIECE_CHARS[(piece.color, piece.king, piece.power_up)]
+        self.board_hash ^= ZOBRIST[(piece.row, piece.col, char)]
+        if self.listener is not None:
+            self.listener.add(char, piece.row, piece.col)
+        if self.recording:
+            self.undo_log.append(('add', piece))
+
+    # Take a piece off the board, keeping the square index, counts and hash in step
+    def remove_piece(self, piece):
+        index = self.pieces.index(piece)
+        del self.pieces[index]
+        del self.squares[(piece.row, piece.col)]
+        self.counts[piece.color] -= 1
+        char = PIECE_CHARS[(piece.color, piece.king, piece.power_up)]
+        self.board_hash ^= ZOBRIST[(piece.row, piece.col, char)]
+        if self.listener is not None:
+            self.listener.remove(char, piece.row, piece.col)
+        self.progress = True
+        if self.recording:
+            self.undo_log.append(('remove', piece, index))
+
+    # Move a piece to (row,col), keeping the square index and hash in step
+    def relocate_piece(self, piece, row, col):
+        char = PIECE_CHARS[(piece.color, piece.king, piece.power_up)]
+        if self.recording:
+            self.undo_log.append(('move', piece, piece.row, piece.col))
+        del self.squares[(piece.row, piece.col)]
+        self.board_hash ^= ZOBRIST[(piece.row, piece.col, char)] ^ ZOBRIST[(row, col, char)]
+        if self.listener is not None:
+            self.listener.remove(char, piece.row, piece.col)
+            self.listener.add(char, row, col)
+        piece.row = row
+        piece.col = col
+        self.squares[(row, col)] = piece
+
+    # Change a piece's king/power-up flags, keeping the hash in step
+    def set_king_state(self, piece, king, power_up):
+        if self.recording:
+            self.undo_log.append(('king', piece, piece.king, piece.power_up))
+        old_char = PIECE_CHARS[(piece.color, piece.king, piece.power_up)]
+        new_char = PIECE_CHARS[(piece.color, king, power_up)]
+        self.board_hash ^= ZOBRIST[(piece.row, piece.col, old_char)] ^ ZOBRIST[(piece.row, piece.col, new_char)]
+        if self.listener is not None:
+            self.listener.remove(old_char, piece.row, piece.col)
+            self.listener.add(new_char, piece.row, piece.col)
+        piece.king = king
+        piece.power_up = power_up
+
+    # Promote a piece to king with its power-up; counts as progress for the quiet-move rule
+    def promote_piece(self, piece):
+        self.set_king_state(piece, True, True)
+        self.progress = True
 
     # Return the Piece at (row,col) or None if empty
     def get_piece(self, row, col):
-        for piece in self.pieces:
-            if piece.row == row and piece.col == col:
-                return piece
-        return None
+        return self.squares.get((row, col))
     
     # Return True if `player_color` has any capturing move available
     def player_has_capture(self, player_color):
@@ -69,6 +414,7 @@ class GameLogic:
     def end_turn(self):
         self.current_turn = 'red' if self.current_turn == 'blue' else 'blue'
         self.must_continue_capture = None
+        self.record_position()
 
     # Return elapsed game time (seconds)
     def get_time(self):
@@ -83,127 +429,85 @@ class GameLogic:
         
     # Move a piece from start to end if the move is valid; handle captures and promotions
     def move_piece(self, start_row, start_col, end_row, end_col):
-        piece = self.get_piece(start_row, start_col)
-        if not piece or piece.color != self.current_turn:
+        # Validation reads the per-turn move table, which already applies forced capture
+        # and multi-capture rules (only the capturing piece may continue)
+        targets = self.move_table().moves.get((start_row, start_col))
+        if not targets or (end_row, end_col) not in targets:
             return False
+        piece = self.get_piece(start_row, start_col)
+        captured = targets[(end_row, end_col)]
 
-        if self.multi_capture_piece is not None:
-            if piece is not self.multi_capture_piece:
-                return False
-
-        must_capture = self.player_has_capture(self.current_turn)
-
-        # KING MOVES (flying king): allow long-range diagonal moves and captures
-        if piece.king:
-            # Ensure move is along a diagonal
-            drow = end_row - start_row
-            dcol = end_col - start_col
-            if abs(drow) != abs(dcol) or drow == 0:
-                return False
-
-            step_r = 1 if drow > 0 else -1
-            step_c = 1 if dcol > 0 else -1
-
-            encountered = []
-            r, c = start_row + step_r, start_col + step_c
-            while (r != end_row + step_r) and (c != end_col + step_c):
-                p = self.get_piece(r, c)
-                if p:
-                    encountered.append(p)
-                r += step_r
-                c += step_c
-
-            # Destination must be empty
-            if not self.is_empty(end_row, end_col):
-                return False
-
-            # Simple long move (no pieces in between)
-            if len(encountered) == 0:
-                if must_capture:
-                    return False
-                # Move king to destination
-                piece.row = end_row
-                piece.col = end_col
-                # Promotion already present
-                self.multi_capture_piece = None
-                self.end_turn()
-                return True
-
-            # Capture move: must encounter exactly one enemy piece and it must belong to opponent
-            if len(encountered) == 1 and encountered[0].color != piece.color:
-                mid_piece = encountered[0]
-                try:
-                    self.pieces.remove(mid_piece)
-                except ValueError:
-                    pass
-                if mid_piece.color == 'red':
-                    self.red_captured += 1
-                else:
-                    self.blue_captured += 1
-
-                piece.row = end_row
-                piece.col = end_col
-
-                # After capture, check for additional captures for this king
-                if self.piece_has_capture(piece):
-                    self.multi_capture_piece = piece
-                    return True
-                else:
-                    self.multi_capture_piece = None
-                    self.end_turn()
-                    return True
+        if captured is not None:
+            mid_piece = self.get_piece(*captured)
+            self.remove_piece(mid_piece)
+            if mid_piece.color == 'red':
+                self.red_captured += 1
+            else:
+                self.blue_captured += 1
 
-            # Any other pattern is invalid
-            return False
+        self.relocate_piece(piece, end_row, end_col)
+        # Men are crowned on the far row; kings (flying kings) already have their power-up
+        if not piece.king:
+            if piece.color == 'red' and piece.row == self.size - 1:
+                self.promote_piece(piece)
+            if piece.color == 'blue' and piece.row == 0:
+                self.promote_piece(piece)
+
+        # After a capture the same piece must keep capturing while it can
+        if captured is not None and self.piece_has_capture(piece):
+            self.multi_capture_piece = piece
+            return True
+        self.multi_capture_piece = None
+        self.end_turn()
+        return True
 
-        # Non-king (regular) move logic (unchanged)
-        is_simple_move = abs(end_row - start_row) == 1 and abs(end_col - start_col) == 1
-        is_capture_move = abs(end_row - start_row) == 2 and abs(end_col - start_col) == 2
-
-        if is_simple_move:
-            if must_capture:
-                return False
-            if self.is_empty(end_row, end_col):
-                if piece.king or (piece.color == 'red' and end_row > start_row) or (piece.color == 'blue' and end_row < start_row):
-                    piece.row = end_row
-                    piece.col = end_col
-                    if piece.color == 'red' and piece.row == 7:
-                        piece.make_king()
-                    if piece.color == 'blue' and piece.row == 0:
-                        piece.make_king()
-                    self.multi_capture_piece = None
-                    self.end_turn()
-                    return True
-            return False
+    # Square of the piece jumped when `piece` moves to (row,col), or None for a plain move
+    def jumped_square(self, piece, row, col):
+        step_r = 1 if row > piece.row else -1
+        step_c = 1 if col > piece.col else -1
+        r, c = piece.row + step_r, piece.col + step_c
+        while (r, c) != (row, col):
+            if (r, c) in self.squares:
+                return (r, c)
+            r += step_r
+            c += step_c
+        return None
 
-        if is_capture_move:
-            mid_row = (start_row + end_row) // 2
-            mid_col = (start_col + end_col) // 2
-            mid_piece = self.get_piece(mid_row, mid_col)
-            if mid_piece and mid_piece.color != piece.color and self.is_empty(end_row, end_col):
-                try:
-                    self.pieces.remove(mid_piece)
-                except ValueError:
-                    pass
-                if mid_piece.color == 'red':
-                    self.red_captured += 1
-                else:
-                    self.blue_captured += 1
-                piece.row = end_row
-                piece.col = end_col
-                if piece.color == 'red' and piece.row == 7:
-                    piece.make_king()
-                if piece.color == 'blue' and piece.row == 0:
-                    piece.make_king()
-                if self.piece_has_capture(piece):
-                    self.multi_capture_piece = piece
-                    return True
-                else:
-                    self.multi_capture_piece = None
-                    self.end_turn()
-                    return True
+    # Legal moves for the current turn, computed once and reused until the position changes
+    def move_table(self):
+        key = self.position_key()
+        table = self.move_tables.get(key)
+        if table is None:
+            if len(self.move_tables) >= MOVE_TABLE_CACHE:
+                self.move_tables.clear()
+            table = self.move_tables[key] = self.build_move_table(key)
+        return table
+
+    # Compute the MoveTable for the side to move (use move_table() to get the cached one)
+    def build_move_table(self, key):
+        side = [p for p in self.pieces if p.color == self.current_turn]
+        must_capture = self.player_has_capture(self.current_turn)
+        pieces = [self.multi_capture_piece] if self.multi_capture_piece is not None else side
+        moves = {}
+        for p in pieces:
+            targets = {}
+            for r, c in self.get_valid_moves(p, capture=must_capture):
+                targets[(r, c)] = self.jumped_square(p, r, c) if must_capture else None
+            if targets:
+                moves[(p.row, p.col)] = targets
+        # With a capture forced every listed move is a capture, so the movers are the capturing pieces
+        if self.multi_capture_piece is None:
+            capture_squares = list(moves) if must_capture else []
+        else:
+            capture_squares = [(p.row, p.col) for p in side if self.piece_has_capture(p)]
+        burn_cols = []
+        if self.multi_capture_piece is None and not self.must_continue_capture:
+            burn_cols = sorted({p.col for p in side if p.king and p.power_up})
+        return MoveTable(key, moves, must_capture, capture_squares, burn_cols)
 
-        return False
+    # Destinations the piece on (row,col) may move to this turn
+    def move_targets(self, row, col):
+        return list(self.move_table().moves.get((row, col), ()))
 
     # Return True if any piece of the current turn has a mandatory capture
     def has_mandatory_capture(self):
@@ -217,59 +521,41 @@ class GameLogic:
 
     # Check whether a specific piece has at least one capture move available
     def piece_has_capture(self, piece):
+        squares = self.squares
+        square = (piece.row, piece.col)
         # King captures: flying king can jump over a single enemy anywhere along diagonal
-        if getattr(piece, 'king', False):
-            directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-            for dr, dc in directions:
-                r, c = piece.row + dr, piece.col + dc
-                encountered = []
-                while 0 <= r < 8 and 0 <= c < 8:
-                    p = self.get_piece(r, c)
-                    if p:
-                        encountered.append(p)
-                        break
-                    r += dr
-                    c += dc
-                if len(encountered) == 1 and encountered[0].color != piece.color:
-                    # After the enemy, at least one empty square must exist to land
-                    rr, cc = encountered[0].row + dr, encountered[0].col + dc
-                    while 0 <= rr < 8 and 0 <= cc < 8:
-                        if self.is_empty(rr, cc):
-                            return True
-                        # blocked by another piece
-                        break
-                        rr += dr
-                        cc += dc
+        if piece.king:
+            for ray in self.geometry.rays[square]:
+                for i, sq in enumerate(ray):
+                    p = squares.get(sq)
+                    if p is None:
+                        continue
+                    # After the enemy, the next square must be empty to land
+                    if p.color != piece.color and i + 1 < len(ray) and ray[i + 1] not in squares:
+                        return True
+                    break
             # no capture found for king
             return False
 
         # Normal piece single-jump captures
-        for drow in (-2, 2):
-            for dcol in (-2, 2):
-                new_row = piece.row + drow
-                new_col = piece.col + dcol
-                mid_row = piece.row + drow // 2
-                mid_col = piece.col + dcol // 2
-                if 0 <= new_row < 8 and 0 <= new_col < 8 and self.is_empty(new_row, new_col):
-                    mid_piece = self.get_piece(mid_row, mid_col)
-                    if mid_piece and mid_piece.color != piece.color:
-                        return True
+        for mid, landing in self.geometry.jumps[square]:
+            if landing not in squares:
+                mid_piece = squares.get(mid)
+                if mid_piece and mid_piece.color != piece.color:
+                    return True
         return False
 
-
-
-   
     # Return list of valid moves for a piece; if capture=True, prefer capture destinations
     def get_valid_moves(self, piece, capture=False):
         moves = []
-        directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+        squares = self.squares
+        square = (piece.row, piece.col)
 
         if piece.king:
-            for dr, dc in directions:
-                r, c = piece.row + dr, piece.col + dc
+            for ray in self.geometry.rays[square]:
                 jumped = None
-                while 0 <= r < 8 and 0 <= c < 8:
-                    target = self.get_piece(r, c)
+                for sq in ray:
+                    target = squares.get(sq)
                     if target:
                         if target.color == piece.color:
                             break
@@ -278,28 +564,21 @@ class GameLogic:
                         else:
                             break
                     elif jumped:
-                        moves.append((r, c))
+                        moves.append(sq)
                     elif not capture:
-                        moves.append((r, c))
-                    r += dr
-                    c += dc
+                        moves.append(sq)
         else:
-            fwd_dirs = [1] if piece.color == 'red' else [-1]
-            for dr in fwd_dirs:
-                for dc in [-1, 1]:
-                    r, c = piece.row + dr, piece.col + dc
-                    if 0 <= r < 8 and 0 <= c < 8 and self.is_empty(r, c) and not capture:
-                        moves.append((r, c))
-            for dr, dc in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-                r, c = piece.row + dr, piece.col + dc
-                mid_r, mid_c = piece.row + dr // 2, piece.col + dc // 2
-                if 0 <= r < 8 and 0 <= c < 8 and self.is_empty(r, c):
-                    mid_piece = self.get_piece(mid_r, mid_c)
+            if not capture:
+                for sq in self.geometry.forward[piece.color][square]:
+                    if sq not in squares:
+                        moves.append(sq)
+            for mid, landing in self.geometry.jumps[square]:
+                if landing not in squares:
+                    mid_piece = squares.get(mid)
                     if mid_piece and mid_piece.color != piece.color:
-                        moves.append((r, c))
+                        moves.append(landing)
         return moves
 
-                
     # Remove all opponent pieces in a column when a king uses its burn power
     def burn_column(self, col):
         kings = [p for p in self.pieces if p.color == self.current_turn and p.king and p.power_up]
@@ -308,10 +587,10 @@ class GameLogic:
         if not kings:
             return False
         king = kings[0]
-        king.power_up = False 
+        self.set_king_state(king, True, False)
         to_remove = [p for p in self.pieces if p.col == col and p.color != self.current_turn]
         for p in to_remove:
-            self.pieces.remove(p)
+            self.remove_piece(p)
             if p.color == 'red':
                 self.red_captured += 1
             else:
@@ -321,36 +600,100 @@ class GameLogic:
         self.last_burn_col = col
         return True
     
-    # Check for a winner or if current player is stuck (no valid moves)
+    # Every legal action for the side to move: ('move', sr, sc, er, ec) steps and ('burn', col) shots
+    def legal_moves(self):
+        table = self.move_table()
+        moves = [('move', sr, sc, er, ec) for (sr, sc), targets in table.moves.items() for er, ec in targets]
+        moves.extend(('burn', col) for col in table.burn_cols)
+        return moves
+
+    # Play an action produced by legal_moves (or parse_move); returns True if it was legal
+    def apply_move(self, move):
+        if move[0] == 'burn':
+            return self.burn_column(move[1])
+        if move[0] == 'timeout':
+            piece = self.get_piece(move[1], move[2])
+            return piece is not None and self.penalize_piece(piece)
+        return self.move_piece(move[1], move[2], move[3], move[4])
+
+    # Game outcome: 'red' or 'blue' for a winner, 'draw', or None while the game is running
+    def result(self):
+        if not self.counts['red']:
+            return 'blue'
+        if not self.counts['blue']:
+            return 'red'
+        if not self.side_can_move(self.current_turn):
+            return 'red' if self.current_turn == 'blue' else 'blue'
+        if self.draw_reason() is not None:
+            return 'draw'
+        return None
+
+    # Return True if `piece` has at least one move (same answer as bool(get_valid_moves(piece)))
+    def piece_can_move(self, piece):
+        squares = self.squares
+        for dr, neighbour, beyond in self.geometry.steps[(piece.row, piece.col)]:
+            target = squares.get(neighbour)
+            if target is None:
+                if piece.king or (dr == 1) == (piece.color == 'red'):
+                    return True
+            elif target.color != piece.color:
+                if beyond is not None and beyond not in squares:
+                    return True
+        return False
+
+    # Return True if `color` has any move; the last mobile piece found is tried first
+    def side_can_move(self, color):
+        witness = self.mobile_piece[color]
+        if witness is not None and self.squares.get((witness.row, witness.col)) is witness \
+                and self.piece_can_move(witness):
+            return True
+        for piece in self.pieces:
+            if piece.color == color and self.piece_can_move(piece):
+                self.mobile_piece[color] = piece
+                return True
+        self.mobile_piece[color] = None
+        return False
+
+    # Return True if the game is drawn by repetition or by the quiet-move limit
+    def is_draw(self):
+        return self.draw_reason() is not None
+
+    # Name the draw rule that ends the game, or None
+    def draw_reason(self):
+        if self.repetitions.get(self.position_hash(), 0) >= REPETITION_LIMIT:
+            return "repetition"
+        if self.quiet_moves >= self.quiet_move_limit:
+            return "move limit"
+        return None
+
+    # Check for a winner, a stuck player (no valid moves) or a draw
     def winner_check(self):
-        red_pieces = [p for p in self.pieces if p.color == 'red']
-        blue_pieces = [p for p in self.pieces if p.color == 'blue']
-        if not red_pieces:
+        if not self.counts['red']:
             return "Blue Wins!"
-        if not blue_pieces:
+        if not self.counts['blue']:
             return "Red Wins!"
-        current_pieces = red_pieces if self.current_turn == 'red' else blue_pieces
-        has_moves = any(self.get_valid_moves(piece) for piece in current_pieces)
-        if not has_moves:
+        if not self.side_can_move(self.current_turn):
              return f"{self.current_turn.capitalize()} is stuck! Opponent Wins!"
+        reason = self.draw_reason()
+        if reason == "repetition":
+            return "Draw by repetition!"
+        if reason == "move limit":
+            return f"Draw! {self.quiet_move_limit} moves without a capture or promotion."
         return None
 
     # Remove a piece as a penalty (e.g., timeout), update counters, clear capture state and end turn
     def penalize_piece(self, piece):
         removed = False
-        new_pieces = []
-        for p in self.pieces:
-            if p.row == piece.row and p.col == piece.col and p.color == piece.color:
-                removed = True
-                if p.color == 'red':
-                    self.red_captured += 1
-                else:
-                    self.blue_captured += 1
-                continue
-            new_pieces.append(p)
-        self.pieces = new_pieces
+        p = self.get_piece(piece.row, piece.col)
+        if p is not None and p.color == piece.color:
+            removed = True
+            self.remove_piece(p)
+            if p.color == 'red':
+                self.red_captured += 1
+            else:
+                self.blue_captured += 1
         self.multi_capture_piece = None
         self.must_continue_capture = None
         self.must_continue_capture_piece = None
         self.end_turn()
-        return removed
\ No newline at end of file
+        return removed
\ No newline at end of file
@@ -1,12 +1,38 @@
+import os
 import sys
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QPushButton, QStackedWidget, QLabel, QVBoxLayout
 )
 import ui
+import autosave
+import opponent
+import profiling
 
-app = QApplication(sys.argv)
-game = ui.EmberLord()
-game.show()
-sys.exit(app.exec())
+# Directory for the crash-safe autosave (EMBERLORD_AUTOSAVE overrides it)
+AUTOSAVE_DIR = os.environ.get("EMBERLORD_AUTOSAVE", "autosave")
+# Squares per side for new games: 8 (classic), 10 or 12
+BOARD_SIZE = int(os.environ.get("EMBERLORD_BOARD_SIZE", ui.BOARD_SIZE))
+# Side the computer plays ("red" or "blue"); unset means two human players
+COMPUTER_COLOR = os.environ.get("EMBERLORD_COMPUTER")
 
+# Opt-in instrumentation: EMBERLORD_PROFILE=<trace.json> records engine and frame timings
+profiler = None
+if os.environ.get("EMBERLORD_PROFILE"):
+    profiler = profiling.Profiler().install(ui.Board)
 
+app = QApplication(sys.argv)
+game = ui.EmberLord(BOARD_SIZE)
+# Pick up where a crashed or killed session left off
+saved = autosave.load(AUTOSAVE_DIR)
+journal = game.board.attach_autosave(AUTOSAVE_DIR, saved.seq if saved else 0)
+if saved is not None:
+    game.restore_autosave(saved)
+if COMPUTER_COLOR:
+    game.board.set_computer_opponent(opponent.ComputerOpponent(COMPUTER_COLOR))
+game.show()
+status = app.exec()
+journal.close()
+if profiler is not None:
+    print(profiler.report())
+    profiler.export_chrome_trace(os.environ["EMBERLORD_PROFILE"])
+sys.exit(status)
@@ -0,0 +1,204 @@
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import logic
+
+# UCT exploration constant
+EXPLORATION = 1.4
+# Rollouts played per leaf in one worker task (amortises process round trips)
+ROLLOUTS_PER_TASK = 4
+# Safety cap on rollout length; the quiet-move draw rule normally ends games first
+MAX_ROLLOUT_PLIES = 400
+# How deep to look under the previous root when reusing the tree
+REUSE_DEPTH = 4
+
+
+# Play random legal actions until the game ends; returns 'red', 'blue' or 'draw'
+def rollout(game, rng):
+    for _ in range(MAX_ROLLOUT_PLIES):
+        result = game.result()
+        if result is not None:
+            return result
+        game.apply_move(rng.choice(game.legal_moves()))
+    return 'draw'
+
+
+# Worker entry point: `count` rollouts from an exported GameLogic state
+def run_rollouts(state, seed, count):
+    rng = random.Random(seed)
+    tally = {'red': 0, 'blue': 0, 'draw': 0}
+    game = logic.GameLogic()
+    for _ in range(count):
+        game.load_state(state)
+        tally[rollout(game, rng)] += 1
+    return tally
+
+
+class Node:
+    # Search tree node; `score` is counted for the side that played `move`
+    def __init__(self, game, move=None, parent=None):
+        self.move = move
+        self.parent = parent
+        self.player = game.current_turn
+        self.mover = parent.player if parent else None
+        self.key = game.position_key()
+        self.terminal = game.result()
+        self.untried = game.legal_moves() if self.terminal is None else []
+        self.children = []
+        self.visits = 0
+        self.score = 0.0
+
+    # Child with the best UCT value
+    def select(self):
+        log_n = math.log(self.visits or 1)
+        return max(self.children, key=lambda c: c.score / c.visits + EXPLORATION * math.sqrt(log_n / c.visits))
+
+    # Number of nodes in this subtree
+    def size(self):
+        return 1 + sum(child.size() for child in self.children)
+
+
+class MCTSAgent:
+    # UCT search with a reusable tree and rollouts spread over a process pool
+    def __init__(self, rollouts=None, seconds=None, workers=None, seed=None):
+        if rollouts is None and seconds is None:
+            rollouts = 2000
+        self.rollouts = rollouts
+        self.seconds = seconds
+        self.workers = os.cpu_count() if workers is None else workers
+        self.rng = random.Random(seed)
+        self.pool = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        self.root = None
+        self.last_stats = {}
+
+    # Shut the worker pool down
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    # Reuse a node from the previous search if the current position is in the kept subtree
+    def find_root(self, game):
+        key = game.position_key()
+        frontier = [self.root] if self.root is not None else []
+        for _ in range(REUSE_DEPTH + 1):
+            for node in frontier:
+                if node.key == key and node.player == game.current_turn:
+                    node.parent = None
+                    node.move = None
+                    node.mover = None
+                    return node
+            frontier = [child for node in frontier for child in node.children]
+        return Node(game)
+
+    # Walk down the tree by UCT, expand one child and reserve its rollouts with a virtual loss
+    def select_leaf(self, root, game):
+        node = root
+        while not node.untried and node.children:
+            node = node.select()
+            game.apply_move(node.move)
+        if node.untried:
+            move = node.untried.pop(self.rng.randrange(len(node.untried)))
+            game.apply_move(move)
+            child = Node(game, move, node)
+            node.children.append(child)
+            node = child
+        walk = node
+        while walk is not None:
+            walk.visits += ROLLOUTS_PER_TASK
+            walk = walk.parent
+        return node
+
+    # Credit a rollout tally to every node from `node` up to the root
+    def backpropagate(self, node, tally):
+        while node is not None:
+            if node.mover is not None:
+                node.score += tally[node.mover] + 0.5 * tally['draw']
+            node = node.parent
+
+    # Run the search from `game` (not modified) and return the most visited action
+    def choose_move(self, game):
+        start = time.perf_counter()
+        root = self.find_root(game)
+        reused = root.visits
+        work = game.copy()
+        batch = max(1, self.workers) * 2
+        played = 0
+        while True:
+            if self.rollouts is not None and played >= self.rollouts:
+                break
+            if self.seconds is not None and time.perf_counter() - start >= self.seconds:
+                break
+            leaves = []
+            for _ in range(batch):
+                mark = work.checkpoint()
+                leaf = self.select_leaf(root, work)
+                leaves.append((leaf, work.export_state()))
+                work.rollback(mark)
+            tallies = self.evaluate(leaves)
+            for (leaf, _), tally in zip(leaves, tallies):
+                self.backpropagate(leaf, tally)
+            played += ROLLOUTS_PER_TASK * len(leaves)
+        elapsed = time.perf_counter() - start
+        best = max(root.children, key=lambda c: c.visits) if root.children else None
+        self.root = best
+        self.last_stats = {
+            "rollouts": played,
+            "seconds": elapsed,
+            "rollouts_per_second": played / elapsed if elapsed else 0.0,
+            "reused_visits": reused,
+            "tree_nodes": root.size(),
+            "workers": self.workers,
+        }
+        return best.move if best else None
+
+    # Rollout tallies for a batch of leaves, in the pool when there is one
+    def evaluate(self, leaves):
+        tallies = [None] * len(leaves)
+        jobs = []
+        for i, (leaf, state) in enumerate(leaves):
+            if leaf.terminal is not None:
+                tallies[i] = {'red': 0, 'blue': 0, 'draw': 0}
+                tallies[i][leaf.terminal] = ROLLOUTS_PER_TASK
+            else:
+                jobs.append((i, state, self.rng.getrandbits(32)))
+        if self.pool is None:
+            for i, state, seed in jobs:
+                tallies[i] = run_rollouts(state, seed, ROLLOUTS_PER_TASK)
+        else:
+            futures = [(i, self.pool.submit(run_rollouts, state, seed, ROLLOUTS_PER_TASK)) for i, state, seed in jobs]
+            for i, future in futures:
+                tallies[i] = future.result()
+        return tallies
+
+
+# Self-play a few moves from the opening and print rollouts per second for sizing
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Emberlord MCTS throughput check")
+    parser.add_argument("--moves", type=int, default=6)
+    parser.add_argument("--rollouts", type=int)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args(argv)
+
+    agent = MCTSAgent(rollouts=args.rollouts, seconds=None if args.rollouts else args.seconds, workers=args.workers)
+    game = logic.GameLogic()
+    game.reset_board()
+    try:
+        for _ in range(args.moves):
+            if game.result() is not None:
+                break
+            move = agent.choose_move(game)
+            stats = agent.last_stats
+            print(f"{game.current_turn:<4} {logic.move_text(move):<10} rollouts={stats['rollouts']} "
+                  f"{stats['rollouts_per_second']:.0f}/s reused={stats['reused_visits']} nodes={stats['tree_nodes']}")
+            game.apply_move(move)
+    finally:
+        agent.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import argparse
+import os
+import random
+import sys
+from PyQt6.QtWidgets import QApplication, QWidget, QScrollArea, QGridLayout
+from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtCore import Qt, QTimer, QRect
+import logic
+import selfplay
+import ui
+
+# Pixel size of one mini board (board area only) and of the caption strip under it
+MINI_BOARD_PIX = 240
+CAPTION_HEIGHT = 24
+CAPTION_COLOR = QColor(255, 255, 255)
+WINNER_SHADE = QColor(0, 0, 0, 160)
+
+
+class MiniBoard(QWidget):
+    # Display-only live board for spectating: paints a GameLogic with the Board look using the shared
+    # assets and clock. It takes no input and keeps no turn clock; moves come from play() (see SimulDriver)
+    def __init__(self, clock, game=None, title="", board_pix=MINI_BOARD_PIX, parent=None):
+        super().__init__(parent)
+        if game is None:
+            game = logic.GameLogic()
+            game.reset_board()
+        self.clock = clock
+        self.logic = game
+        self.title = title
+        self.board_pix = board_pix
+        self.turn_time = None
+        self.assets = ui.shared_assets()
+        self.setFixedSize(board_pix, board_pix + CAPTION_HEIGHT)
+        self.set_board_size(game.size)
+        # Running burn animation: (column or None, square or None, start time in clock ms)
+        self.burn = None
+        self.flash = None
+        self.dirty = True
+
+    # Pick up geometry and sprites for a size x size game
+    def set_board_size(self, size):
+        self.grid = ui.board_grid(size, self.board_pix, 0, 0)
+        sq = self.grid.square_size
+        self.sprites = {name: self.assets.pixmap(path, sq, sq) for name, path in ui.PIECE_IMAGES.items()}
+
+    # Replace the game shown (e.g. a new round on this table)
+    def set_game(self, game):
+        self.logic = game
+        if game.size != self.grid.size:
+            self.set_board_size(game.size)
+        self.burn = None
+        self.changed()
+
+    # Play an action on this board's game; burns and timeouts start their lava animation
+    def play(self, move):
+        if not self.logic.apply_move(move):
+            return False
+        if move[0] == 'burn':
+            self.burn = (move[1], None, self.clock.now())
+        elif move[0] == 'timeout':
+            self.burn = (None, (move[1], move[2]), self.clock.now())
+        self.changed()
+        return True
+
+    # The game changed outside play(); repaint if anyone can see it
+    def changed(self):
+        self.dirty = True
+        if self.is_onscreen():
+            self.update()
+
+    def is_onscreen(self):
+        return self.isVisible() and not self.visibleRegion().isEmpty()
+
+    # Clock tick: repaint only when the position, the pulse phase or a running animation asks for it
+    def advance(self, now):
+        if self.burn is not None:
+            frames, delay = self.assets.frames(ui.LAVA_ANIMATION)
+            if now - self.burn[2] >= len(frames) * delay:
+                self.burn = None
+            self.dirty = True
+        flash = self.clock.flash_on(now) if self.logic.move_table().capture_squares else None
+        if flash != self.flash:
+            self.flash = flash
+            self.dirty = True
+        if self.dirty:
+            self.update()
+
+    def paintEvent(self, event):
+        self.dirty = False
+        painter = QPainter(self)
+        grid = self.grid
+        sq = grid.square_size
+        side = sq * grid.size
+        painter.drawPixmap(0, 0, self.assets.pixmap(ui.BACKGROUND_IMAGE, self.width(), self.height(),
+                                                    Qt.AspectRatioMode.IgnoreAspectRatio))
+        for rect, color in grid.cells:
+            painter.fillRect(rect, color)
+
+        if self.flash is not None:
+            overlay = QColor(0, 200, 0)
+            overlay.setAlpha(220 if self.flash else 100)
+            for square in self.logic.move_table().capture_squares:
+                for edge in grid.frames[square]:
+                    painter.fillRect(edge, overlay)
+
+        if self.burn is not None:
+            column, square, start = self.burn
+            if column is not None:
+                frames, delay = self.assets.frames(ui.LAVA_ANIMATION, sq, side)
+                target = grid.columns[column]
+            else:
+                frames, delay = self.assets.frames(ui.LAVA_ANIMATION, sq, sq)
+                target = grid.rects[square]
+            index = min((self.clock.now() - start) // delay, len(frames) - 1)
+            painter.drawPixmap(target, frames[index])
+
+        for piece in self.logic.pieces:
+            name = f"{piece.color}_{'king' if piece.king else 'piece'}"
+            painter.drawPixmap(grid.rects[(piece.row, piece.col)], self.sprites[name])
+
+        caption = f"{self.title}  {self.logic.current_turn} to move"
+        if self.turn_time is not None:
+            caption += f"  {self.turn_time}s"
+        painter.setPen(CAPTION_COLOR)
+        painter.drawText(QRect(4, side, self.width() - 8, CAPTION_HEIGHT),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, caption)
+        winner = self.logic.winner_check()
+        if winner:
+            painter.fillRect(QRect(0, 0, side, side), WINNER_SHADE)
+            painter.drawText(QRect(0, 0, side, side), Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, winner)
+
+
+class MultiBoardView(QScrollArea):
+    # Scrollable grid of mini boards sharing the AssetCache and the AnimationClock with every ui.Board
+    def __init__(self, columns=4, board_pix=MINI_BOARD_PIX, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Emberlord")
+        self.columns = columns
+        self.board_pix = board_pix
+        self.clock = ui.shared_clock()
+        self.boards = []
+        self.container = QWidget()
+        self.layout_grid = QGridLayout(self.container)
+        self.layout_grid.setSpacing(8)
+        self.setWidget(self.container)
+        self.setWidgetResizable(True)
+        self.setStyleSheet("background-color: rgb(30, 20, 15);")
+
+    # Add a live board (a fresh game unless `game` is given) and return it
+    def add_board(self, game=None, title=""):
+        board = MiniBoard(self.clock, game, title or f"Board {len(self.boards) + 1}", self.board_pix)
+        index = len(self.boards)
+        self.layout_grid.addWidget(board, index // self.columns, index % self.columns)
+        self.boards.append(board)
+        self.clock.add(board)
+        return board
+
+    def remove_board(self, board):
+        self.clock.remove(board)
+        self.boards.remove(board)
+        self.layout_grid.removeWidget(board)
+        board.deleteLater()
+
+
+class SimulDriver:
+    # Demo driver: plays self-play moves round-robin on every board of a view, restarting finished games
+    def __init__(self, view, interval=300, seed=0, red="greedy", blue="random"):
+        self.view = view
+        self.rng = random.Random(seed)
+        self.policies = {'red': red, 'blue': blue}
+        self.next_board = 0
+        self.moves = 0
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.step)
+        self.timer.start(interval)
+
+    def step(self):
+        boards = self.view.boards
+        if not boards:
+            return
+        board = boards[self.next_board % len(boards)]
+        self.next_board += 1
+        game = board.logic
+        if game.result() is not None or len(game.history) > selfplay.MAX_PLIES:
+            fresh = logic.GameLogic(game.size)
+            fresh.reset_board()
+            board.set_game(fresh)
+            return
+        board.play(selfplay.choose_move(self.policies[game.current_turn], game, self.rng))
+        self.moves += 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show many live Emberlord games in one window")
+    parser.add_argument("--boards", type=int, default=16)
+    parser.add_argument("--columns", type=int, default=4)
+    parser.add_argument("--size", type=int, choices=logic.BOARD_SIZES, default=ui.BOARD_SIZE)
+    parser.add_argument("--board-pix", type=int, default=MINI_BOARD_PIX)
+    parser.add_argument("--move-ms", type=int, default=300, help="one move on one board every this many ms")
+    args = parser.parse_args(argv)
+
+    # ui.py loads its images from paths relative to this folder
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    app = QApplication(sys.argv)
+    view = MultiBoardView(args.columns, args.board_pix)
+    for _ in range(args.boards):
+        game = logic.GameLogic(args.size)
+        game.reset_board()
+        view.add_board(game)
+    view.resize(1024, ui.WINDOW_SIZE)
+    driver = SimulDriver(view, args.move_ms)
+    view.show()
+    status = app.exec()
+    clock = view.clock
+    total = clock.advanced + clock.skipped
+    print(f"{driver.moves} moves on {len(view.boards)} boards; {clock.advanced} board ticks rendered, "
+          f"{clock.skipped} skipped offscreen ({clock.skipped / total * 100 if total else 0:.0f}%)")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import threading
+import search
+
+# Seconds the computer thinks when its position was not pondered
+THINK_SECONDS = 1.0
+# Opponent replies pondered in parallel during the human's turn
+PONDER_REPLIES = 4
+# Deepest ponder iteration; pondering stops by itself after this
+PONDER_MAX_DEPTH = 12
+# Pondered results this deep are trusted before the first real think has measured THINK_SECONDS
+PONDER_TRUST_DEPTH = PONDER_MAX_DEPTH // 2
+
+
+# Every position that can be reached by the end of the current side's turn (capture chains expanded)
+def turn_outcomes(game, limit=64):
+    outcomes = []
+    turn = game.current_turn
+
+    def expand(current):
+        for move in current.legal_moves():
+            if len(outcomes) >= limit:
+                return
+            mark = current.checkpoint()
+            current.apply_move(move)
+            if current.current_turn == turn and current.result() is None:
+                expand(current)
+            else:
+                outcomes.append(current.copy())
+            current.rollback(mark)
+
+    expand(game.copy())
+    return outcomes
+
+
+class ComputerOpponent:
+    # Search-based opponent that keeps thinking during the human's turn. All searching happens on one
+    # worker thread at a time (ponder or think), so the table and pondered results are never shared
+    def __init__(self, color='red', think_seconds=THINK_SECONDS, ponder_replies=PONDER_REPLIES):
+        self.color = color
+        self.think_seconds = think_seconds
+        self.ponder_replies = ponder_replies
+        self.table = {}
+        self.pondered = {}
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.last_result = None
+        self.ponder_hit = False
+        # Depth the last full think_seconds search reached; shallower pondered results are not trusted
+        self.think_depth = None
+
+    # Pick the move for the side to move; a pondered position searched at least as deep as a normal
+    # think is answered straight from memory, otherwise the search runs again on the warmed table.
+    # Runs on the worker thread; a set `stop` cuts the search short
+    def choose_move(self, game, stop=None):
+        moves = game.legal_moves()
+        if len(moves) == 1:
+            self.ponder_hit = False
+            return moves[0]
+        result = self.pondered.get(game.position_key())
+        trusted = PONDER_TRUST_DEPTH if self.think_depth is None else self.think_depth
+        self.ponder_hit = result is not None and result.move is not None and result.depth >= trusted
+        if not self.ponder_hit:
+            result = search.Searcher(table=self.table).search(game, seconds=self.think_seconds, stop=stop)
+            if stop is None or not stop.is_set():
+                self.think_depth = result.depth
+        self.last_result = result
+        return result.move
+
+    # Think about the computer's whole turn in the background and call `deliver(moves)` from the worker
+    # thread: the moves of the turn in order, ending early at a burn, or None if stopped before finishing
+    def request_turn(self, game, deliver):
+        self.start_worker(self.play_turn, game.copy(), deliver)
+
+    # Background worker: choose every step of the turn on a private copy. Pondered continuation
+    # positions stay available until the whole turn is chosen
+    def play_turn(self, game, deliver, stop):
+        turn = game.current_turn
+        moves = []
+        while game.current_turn == turn and game.result() is None and not stop.is_set():
+            move = self.choose_move(game, stop)
+            if move is None:
+                break
+            moves.append(move)
+            if move[0] == 'burn' or not game.apply_move(move):
+                break
+        self.pondered.clear()
+        deliver(None if stop.is_set() else moves)
+
+    # Start searching the likely human replies in the background
+    def start_pondering(self, game):
+        self.stop_pondering()
+        if game.result() is not None or game.current_turn == self.color:
+            return
+        self.start_worker(self.ponder, game.copy())
+
+    # Run target(*args, stop) on a new worker once the previous one has wound down; the waiting
+    # happens on the new worker, so the caller (the GUI thread) never blocks
+    def start_worker(self, target, *args):
+        self.stop_pondering()
+        previous = self.thread
+        stop = self.stop_event = threading.Event()
+
+        def run():
+            if previous is not None:
+                previous.join()
+            target(*args, stop)
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+
+    # Ask the background search (ponder or think) to stop without waiting for it; keeps the table and
+    # pondered results
+    def stop_pondering(self):
+        self.stop_event.set()
+
+    # Background worker: deepen the search behind each likely reply in turn until stopped
+    def ponder(self, game, stop):
+        quick = search.Searcher(table=self.table)
+        replies = []
+        for outcome in turn_outcomes(game):
+            if stop.is_set():
+                return
+            if outcome.result() is not None:
+                continue
+            # Score from the human's side: a reply that is bad for the computer is more likely
+            score = -quick.search(outcome, depth=1).score
+            replies.append((score, outcome))
+        replies.sort(key=lambda item: -item[0])
+        positions = [outcome for _, outcome in replies[:self.ponder_replies]]
+        searcher = search.Searcher(table=self.table)
+        for depth in range(1, PONDER_MAX_DEPTH + 1):
+            for position in positions:
+                if stop.is_set():
+                    return
+                result = searcher.search(position, depth=depth, stop=stop)
+                if result.depth == depth:
+                    self.pondered[position.position_key()] = result
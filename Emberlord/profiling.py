@@ -0,0 +1,161 @@
+import json
+import os
+import random
+import threading
+import time
+import logic
+
+# GameLogic hot paths that get wrapped when profiling is switched on
+ENGINE_METHODS = ("get_piece", "piece_has_capture", "get_valid_moves", "move_piece", "winner_check")
+# ui.Board methods: paintEvent gives frame times, the rest are timer wakeups
+BOARD_METHODS = {
+    "paintEvent": "frame",
+    "update_turn_timer": "timer",
+    "advance": "timer",
+    "clear_highlight": "timer",
+}
+# Upper bound on stored trace events so a long session cannot eat all memory
+MAX_EVENTS = 500000
+# Durations kept per method for percentiles (a uniform sample once a method has been called more often)
+RESERVOIR_SIZE = 10000
+
+
+class MethodStats:
+    # Running summary of one method's call durations in ns: exact count, total, max and log2 histogram,
+    # percentiles from a fixed-size reservoir sample, so memory stays flat however often the method runs
+    def __init__(self, category, reservoir_size, rng):
+        self.category = category
+        self.reservoir_size = reservoir_size
+        self.rng = rng
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = {}
+        self.sample = []
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        bucket = 1 << max(0, (duration // 1000).bit_length())
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        if len(self.sample) < self.reservoir_size:
+            self.sample.append(duration)
+        else:
+            slot = self.rng.randrange(self.count)
+            if slot < self.reservoir_size:
+                self.sample[slot] = duration
+
+
+class Profiler:
+    # Call counts, durations and trace events for instrumented methods
+    def __init__(self, max_events=MAX_EVENTS, reservoir_size=RESERVOIR_SIZE):
+        self.max_events = max_events
+        self.reservoir_size = reservoir_size
+        self.rng = random.Random(0)
+        self.samples = {}
+        self.events = []
+        self.originals = []
+        self.origin = time.perf_counter_ns()
+
+    # Store one finished call; durations are kept in nanoseconds
+    def record(self, name, category, start, end):
+        stats = self.samples.get(name)
+        if stats is None:
+            stats = self.samples[name] = MethodStats(category, self.reservoir_size, self.rng)
+        stats.add(end - start)
+        if len(self.events) < self.max_events:
+            self.events.append((name, category, start, end - start, threading.get_ident()))
+
+    # Replace `cls.method_name` with a timing wrapper and remember the original
+    def wrap(self, cls, method_name, category):
+        original = cls.__dict__[method_name]
+        name = f"{cls.__name__}.{method_name}"
+        record = self.record
+        clock = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(name, category, start, clock())
+
+        timed.__name__ = original.__name__
+        setattr(cls, method_name, timed)
+        self.originals.append((cls, method_name, original))
+
+    # Instrument GameLogic and, when given, the ui.Board class
+    def install(self, board_class=None):
+        if self.originals:
+            return self
+        for method_name in ENGINE_METHODS:
+            self.wrap(logic.GameLogic, method_name, "engine")
+        if board_class is not None:
+            for method_name, category in BOARD_METHODS.items():
+                self.wrap(board_class, method_name, category)
+        return self
+
+    # Put back the original methods so profiling costs nothing again
+    def uninstall(self):
+        for cls, method_name, original in reversed(self.originals):
+            setattr(cls, method_name, original)
+        self.originals = []
+
+    # Drop every recorded sample and event
+    def clear(self):
+        self.samples.clear()
+        self.events = []
+
+    # Sampled call durations (ns) of one method; every call while fewer than reservoir_size were made
+    def durations(self, name):
+        stats = self.samples.get(name)
+        return list(stats.sample) if stats is not None else []
+
+    # Summary per method: count, total, mean, percentiles and a log2 histogram in microseconds
+    def stats(self):
+        result = {}
+        for name, s in self.samples.items():
+            ordered = sorted(s.sample)
+            n = len(ordered)
+            result[name] = {
+                "category": s.category,
+                "count": s.count,
+                "total_ms": s.total / 1e6,
+                "mean_us": s.total / s.count / 1e3,
+                "p50_us": ordered[n // 2] / 1e3,
+                "p95_us": ordered[min(n - 1, int(n * 0.95))] / 1e3,
+                "max_us": s.max / 1e3,
+                "histogram_us": dict(sorted(s.buckets.items())),
+            }
+        return result
+
+    # Human-readable histogram report, heaviest methods first
+    def report(self):
+        lines = []
+        stats = self.stats()
+        for name, s in sorted(stats.items(), key=lambda item: -item[1]["total_ms"]):
+            lines.append(f"{name} [{s['category']}] calls={s['count']} total={s['total_ms']:.2f}ms "
+                         f"mean={s['mean_us']:.1f}us p50={s['p50_us']:.1f}us p95={s['p95_us']:.1f}us max={s['max_us']:.1f}us")
+            peak = max(s["histogram_us"].values())
+            for bucket, n in s["histogram_us"].items():
+                bar = "#" * max(1, n * 40 // peak)
+                lines.append(f"    <{bucket:>8}us {n:>9} {bar}")
+        return "\n".join(lines)
+
+    # Write the recorded events as a Chrome trace (chrome://tracing, Perfetto)
+    def export_chrome_trace(self, path):
+        pid = os.getpid()
+        trace = [{
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.origin) / 1e3,
+            "dur": duration / 1e3,
+            "pid": pid,
+            "tid": tid,
+        } for name, category, start, duration, tid in self.events]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        return len(trace)
@@ -0,0 +1,229 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import logic
+import results
+import selfplay
+
+# Turns (plies) within which the puzzle's single winning move must force the win
+PLIES = 3
+# Solver nodes allowed per candidate; positions that need more are skipped rather than stalling a worker
+MAX_NODES = 20000
+# Full turns (capture chains expanded) examined at the root of a candidate
+MAX_TURNS = 128
+
+
+class SolverBudget(Exception):
+    pass
+
+
+class Solver:
+    # Proves forced wins: the attacker needs one winning reply, the defender must have none that escapes
+    def __init__(self, max_nodes=MAX_NODES):
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.table = {}
+
+    # True if `attacker` wins within `depth` more turns from here, whatever the defender does;
+    # steps inside a capture chain belong to the same turn and keep the depth
+    def wins(self, game, attacker, depth):
+        result = game.result()
+        if result is not None:
+            return result == attacker
+        if depth <= 0:
+            return False
+        key = (game.position_key(), depth)
+        known = self.table.get(key)
+        if known is not None:
+            return known
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise SolverBudget()
+        turn = game.current_turn
+        attacking = turn == attacker
+        value = not attacking
+        for move in game.legal_moves():
+            mark = game.checkpoint()
+            game.apply_move(move)
+            won = self.wins(game, attacker, depth if game.current_turn == turn else depth - 1)
+            game.rollback(mark)
+            if won == attacking:
+                value = won
+                break
+        self.table[key] = value
+        return value
+
+
+# Every full turn for the side to move as a list of steps (a capture chain is one turn); None past `limit`
+def turn_sequences(game, limit=MAX_TURNS):
+    sequences = []
+    turn = game.current_turn
+
+    def expand(steps):
+        for move in game.legal_moves():
+            if len(sequences) > limit:
+                return
+            mark = game.checkpoint()
+            game.apply_move(move)
+            if game.current_turn == turn and game.result() is None:
+                expand(steps + [move])
+            else:
+                sequences.append(steps + [move])
+            game.rollback(mark)
+
+    expand([])
+    return sequences if len(sequences) <= limit else None
+
+
+# Tactical motifs in a solution: burn, capture / multi_capture, flying_king, promotion (else quiet)
+def solution_themes(game, steps):
+    game = game.copy()
+    themes = set()
+    captures = 0
+    for move in steps:
+        if move[0] == 'burn':
+            themes.add("burn")
+        else:
+            _, sr, sc, er, ec = move
+            piece = game.get_piece(sr, sc)
+            was_king = piece.king
+            jumped = game.move_table().moves[(sr, sc)][(er, ec)]
+            if jumped is not None:
+                captures += 1
+            if was_king and abs(er - sr) > (2 if jumped is not None else 1):
+                themes.add("flying_king")
+            if not was_king and piece.king:
+                themes.add("promotion")
+        game.apply_move(move)
+    if captures > 1:
+        themes.add("multi_capture")
+    elif captures:
+        themes.add("capture")
+    return sorted(themes) or ["quiet"]
+
+
+# The puzzle hidden in `game`, or None: the side to move must have exactly one turn that wins within `plies`
+def find_puzzle(game, plies=PLIES, max_nodes=MAX_NODES):
+    attacker = game.current_turn
+    work = game.copy()
+    sequences = turn_sequences(work)
+    if sequences is None or len(sequences) < 2:
+        return None
+    solver = Solver(max_nodes)
+    winner = None
+    try:
+        for steps in sequences:
+            mark = work.checkpoint()
+            for move in steps:
+                work.apply_move(move)
+            won = solver.wins(work, attacker, plies - 1)
+            work.rollback(mark)
+            if won:
+                if winner is not None:
+                    return None
+                winner = steps
+        if winner is None:
+            return None
+        # Shortest win for the solution, for grading
+        mark = work.checkpoint()
+        for move in winner:
+            work.apply_move(move)
+        depth = next(d for d in range(plies) if solver.wins(work, attacker, d))
+        work.rollback(mark)
+    except SolverBudget:
+        return None
+    return {
+        "hash": f"{game.position_hash():016x}",
+        "position": game.position_text(),
+        "solution": [logic.move_text(m) for m in winner],
+        "plies": depth + 1,
+        "themes": solution_themes(game, winner),
+        "turns": len(sequences),
+    }
+
+
+# Positions at the start of every turn of a stored game, with the ply they occur at
+def turn_positions(record):
+    game = results.record_game(record)
+    yield 0, game
+    for ply, move in enumerate(results.record_moves(record), 1):
+        if not game.apply_move(move):
+            break
+        if game.multi_capture_piece is None and game.result() is None:
+            yield ply, game
+
+
+# Worker entry point: play one self-play game and check each of its positions; returns (checked, puzzles)
+def mine_game(job):
+    seed, red, blue, plies, max_nodes = job
+    record = selfplay.play_game(seed, red, blue)
+    checked = 0
+    found = []
+    seen = set()
+    for ply, game in turn_positions(record):
+        key = game.position_hash()
+        if key in seen:
+            continue
+        seen.add(key)
+        checked += 1
+        puzzle = find_puzzle(game, plies, max_nodes)
+        if puzzle is not None:
+            puzzle["source"] = {"seed": seed, "ply": ply, "red": red, "blue": blue}
+            found.append(puzzle)
+    return checked, found
+
+
+# Yield (checked, puzzles) per self-play game, mined on a process pool when workers > 1
+def mine(games, workers=None, seed=0, red="greedy", blue="random", plies=PLIES, max_nodes=MAX_NODES):
+    workers = os.cpu_count() if workers is None else workers
+    jobs = ((seed + i, red, blue, plies, max_nodes) for i in range(games))
+    if workers <= 1:
+        yield from map(mine_game, jobs)
+        return
+    with ProcessPoolExecutor(workers) as pool:
+        yield from pool.map(mine_game, jobs, chunksize=4)
+
+
+# Hashes of the puzzles already in a puzzle file, so a rerun only appends new ones
+def known_hashes(path):
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return {json.loads(line)["hash"] for line in f if line.strip()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mine single-solution Emberlord puzzles from self-play")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--red", choices=selfplay.POLICIES, default="greedy")
+    parser.add_argument("--blue", choices=selfplay.POLICIES, default="random")
+    parser.add_argument("--plies", type=int, default=PLIES, help="the win must come within this many turns")
+    parser.add_argument("--max-nodes", type=int, default=MAX_NODES)
+    parser.add_argument("--out", default="puzzles.jsonl")
+    args = parser.parse_args(argv)
+
+    seen = known_hashes(args.out)
+    start = time.perf_counter()
+    checked = written = duplicates = 0
+    with open(args.out, "a") as f:
+        for count, found in mine(args.games, args.workers, args.seed, args.red, args.blue,
+                                 args.plies, args.max_nodes):
+            checked += count
+            for puzzle in found:
+                if puzzle["hash"] in seen:
+                    duplicates += 1
+                    continue
+                seen.add(puzzle["hash"])
+                f.write(json.dumps(puzzle) + "\n")
+                written += 1
+    elapsed = time.perf_counter() - start
+    print(f"{checked} candidates in {elapsed:.1f}s ({checked / elapsed:.0f} positions/s), "
+          f"{written} new puzzles, {duplicates} duplicates -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import sqlite3
+import time
+import logic
+
+# Rows buffered before a transaction is written
+BATCH_SIZE = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    size INTEGER NOT NULL DEFAULT 8,
+    source TEXT,
+    red_player TEXT,
+    blue_player TEXT,
+    seed INTEGER,
+    result TEXT NOT NULL,
+    reason TEXT,
+    plies INTEGER NOT NULL,
+    red_captured INTEGER NOT NULL,
+    blue_captured INTEGER NOT NULL,
+    red_burns INTEGER NOT NULL,
+    blue_burns INTEGER NOT NULL,
+    first_burn_ply INTEGER,
+    timeouts INTEGER NOT NULL,
+    moves TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_first_burn ON games (first_burn_ply, result);
+CREATE INDEX IF NOT EXISTS games_by_timeouts ON games (timeouts, result);
+CREATE INDEX IF NOT EXISTS games_by_players ON games (red_player, blue_player, result);
+"""
+
+COLUMNS = ("played_at", "size", "source", "red_player", "blue_player", "seed", "result", "reason", "plies",
+           "red_captured", "blue_captured", "red_burns", "blue_burns", "first_burn_ply", "timeouts", "moves")
+# Separator for the stored move list (move_text itself contains spaces)
+MOVE_SEPARATOR = ";"
+
+
+class GameRecorder:
+    # Plays actions on a GameLogic and keeps the statistics a results row needs
+    def __init__(self, game=None):
+        if game is None:
+            game = logic.GameLogic()
+            game.reset_board()
+        self.game = game
+        self.moves = []
+        self.burns = {'red': 0, 'blue': 0}
+        self.first_burn_ply = None
+        self.timeouts = 0
+
+    # Apply an action ('move', 'burn' or 'timeout') and log it; returns False if it was illegal
+    def play(self, move):
+        color = self.game.current_turn
+        if not self.game.apply_move(move):
+            return False
+        if move[0] == 'burn':
+            self.burns[color] += 1
+            if self.first_burn_ply is None:
+                self.first_burn_ply = len(self.moves)
+        elif move[0] == 'timeout':
+            self.timeouts += 1
+        self.moves.append(logic.move_text(move))
+        return True
+
+    # The finished game as a dict with one key per results column
+    def record(self, source="selfplay", red_player=None, blue_player=None, seed=None):
+        game = self.game
+        result = game.result()
+        reason = game.draw_reason() if result == 'draw' else None
+        if result is None:
+            result, reason = 'draw', 'unfinished'
+        return {
+            "played_at": time.time(),
+            "size": game.size,
+            "source": source,
+            "red_player": red_player,
+            "blue_player": blue_player,
+            "seed": seed,
+            "result": result,
+            "reason": reason,
+            "plies": len(self.moves),
+            "red_captured": game.red_captured,
+            "blue_captured": game.blue_captured,
+            "red_burns": self.burns['red'],
+            "blue_burns": self.burns['blue'],
+            "first_burn_ply": self.first_burn_ply,
+            "timeouts": self.timeouts,
+            "moves": MOVE_SEPARATOR.join(self.moves),
+        }
+
+
+# Turn a stored move string back into action tuples
+def record_moves(record):
+    return [logic.parse_move(text) for text in record["moves"].split(MOVE_SEPARATOR) if text]
+
+
+# The starting position a stored game was played from, on its board size (8x8 for records without one)
+def record_game(record):
+    game = logic.GameLogic(record.get("size") or logic.DEFAULT_SIZE)
+    game.reset_board()
+    return game
+
+
+class ResultsStore:
+    # SQLite (WAL) store of finished games; inserts are buffered and written in batches
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        # Databases written before board sizes existed hold only 8x8 games
+        if "size" not in {row[1] for row in self.conn.execute("PRAGMA table_info(games)")}:
+            with self.conn:
+                self.conn.execute("ALTER TABLE games ADD COLUMN size INTEGER NOT NULL DEFAULT 8")
+        self.pending = []
+        self.written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Queue one record (a dict from GameRecorder.record); writes when the batch is full
+    def add(self, record):
+        self.pending.append(tuple(record[column] for column in COLUMNS))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    # Write every queued record in one transaction
+    def flush(self):
+        if not self.pending:
+            return
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                self.pending)
+        self.written += len(self.pending)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    # Number of stored games
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    # Fetch stored games as dicts, newest last
+    def games(self, where="1", params=(), limit=None):
+        sql = f"SELECT id, {', '.join(COLUMNS)} FROM games WHERE {where} ORDER BY id"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        cursor = self.conn.execute(sql, params)
+        names = [d[0] for d in cursor.description]
+        for row in cursor:
+            yield dict(zip(names, row))
+
+    # Red/blue/draw counts and rates grouped by an SQL expression over the games table
+    def outcome_rates(self, group_expr, where="1", params=()):
+        rows = self.conn.execute(
+            f"SELECT {group_expr} AS grp, COUNT(*), SUM(result = 'red'), SUM(result = 'blue'), SUM(result = 'draw') "
+            f"FROM games WHERE {where} GROUP BY grp ORDER BY grp", params).fetchall()
+        return [{
+            "group": grp,
+            "games": n,
+            "red_rate": red / n,
+            "blue_rate": blue / n,
+            "draw_rate": draw / n,
+        } for grp, n, red, blue, draw in rows]
+
+    # Win rates by the ply of the first burn, bucketed (None = no burn in the game)
+    def win_rate_by_first_burn(self, bucket=10):
+        return self.outcome_rates(f"(first_burn_ply / {int(bucket)}) * {int(bucket)}")
+
+    # Win rates split by whether any timeout penalty happened
+    def win_rate_by_timeout(self):
+        return self.outcome_rates("timeouts > 0")
+
+    # Win rates per pairing of player names
+    def win_rate_by_players(self):
+        return self.outcome_rates("red_player || ' vs ' || blue_player")
@@ -0,0 +1,293 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import logic
+
+WIN = 100000
+INF = 10 ** 9
+# Transposition table bound flags
+EXACT, LOWER, UPPER = 0, 1, 2
+# Entries kept before the table is cleared
+TABLE_SIZE = 1 << 20
+# Piece values used by material_eval
+MAN_VALUE = 100
+KING_VALUE = 250
+BURN_VALUE = 60
+MAX_DEPTH = 64
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+# Material count from the point of view of the side to move
+def material_eval(game):
+    score = 0
+    for p in game.pieces:
+        value = KING_VALUE + BURN_VALUE * p.power_up if p.king else MAN_VALUE
+        score += value if p.color == game.current_turn else -value
+    return score
+
+
+# Captures, promotions and burns first; they are the moves that change the material balance
+def order_moves(moves, first=None):
+    def rank(move):
+        if move == first:
+            return 0
+        if move[0] == 'burn' or abs(move[3] - move[1]) > 1:
+            return 1
+        return 2
+    return sorted(moves, key=rank)
+
+
+class SearchResult:
+    # Outcome of a search: best move, its score, completed depth, principal variation and node count
+    def __init__(self, move, score, depth, pv, nodes, seconds):
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.pv = pv
+        self.nodes = nodes
+        self.seconds = seconds
+
+    def as_dict(self):
+        return {
+            "move": logic.move_text(self.move) if self.move else None,
+            "score": self.score,
+            "depth": self.depth,
+            "pv": [logic.move_text(m) for m in self.pv],
+            "nodes": self.nodes,
+            "seconds": round(self.seconds, 4),
+        }
+
+
+class Searcher:
+    # Iterative-deepening alpha-beta (negamax) with a transposition table
+    def __init__(self, evaluate=material_eval, table=None):
+        self.evaluate = evaluate
+        self.table = {} if table is None else table
+        self.nodes = 0
+        self.deadline = None
+        self.stop = None
+        # Best result of every completed iteration of the last search, shallowest first
+        self.iterations = []
+
+    # Negamax value of `game` for the side to move; a capture chain keeps the side and the depth
+    def negamax(self, game, depth, alpha, beta, ply):
+        self.nodes += 1
+        if not self.nodes & 1023:
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchTimeout()
+            if self.stop is not None and self.stop.is_set():
+                raise SearchTimeout()
+        result = game.result()
+        if result is not None:
+            if result == 'draw':
+                return 0
+            return WIN - ply if result == game.current_turn else ply - WIN
+        if depth <= 0:
+            return self.evaluate(game)
+
+        key = game.position_key()
+        entry = self.table.get(key)
+        tt_move = None
+        if entry is not None:
+            e_depth, e_value, e_flag, tt_move = entry
+            if e_depth >= depth:
+                if e_flag == EXACT or (e_flag == LOWER and e_value >= beta) or (e_flag == UPPER and e_value <= alpha):
+                    return e_value
+
+        alpha_start = alpha
+        best, best_move = -INF, None
+        turn = game.current_turn
+        for move in order_moves(game.legal_moves(), tt_move):
+            mark = game.checkpoint()
+            game.apply_move(move)
+            if game.current_turn == turn:
+                value = self.negamax(game, depth, alpha, beta, ply + 1)
+            else:
+                value = -self.negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            game.rollback(mark)
+            if value > best:
+                best, best_move = value, move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break
+
+        flag = UPPER if best <= alpha_start else LOWER if best >= beta else EXACT
+        if len(self.table) >= TABLE_SIZE:
+            self.table.clear()
+        self.table[key] = (depth, best, flag, best_move)
+        return best
+
+    # Score each of `moves` at `depth` from the root; returns [(score, move)] best first
+    def search_root(self, game, moves, depth):
+        scored = []
+        alpha = -INF
+        turn = game.current_turn
+        for move in moves:
+            mark = game.checkpoint()
+            game.apply_move(move)
+            if game.current_turn == turn:
+                value = self.negamax(game, depth, alpha, INF, 1)
+            else:
+                value = -self.negamax(game, depth - 1, -INF, -alpha, 1)
+            game.rollback(mark)
+            scored.append((value, move))
+            alpha = max(alpha, value)
+        scored.sort(key=lambda item: -item[0])
+        return scored
+
+    # Follow transposition-table best moves from the current position
+    def principal_variation(self, game, first, limit=16):
+        pv = [first]
+        mark = game.checkpoint()
+        game.apply_move(first)
+        seen = {game.position_key()}
+        while len(pv) < limit:
+            entry = self.table.get(game.position_key())
+            if entry is None or entry[3] is None or not game.apply_move(entry[3]):
+                break
+            pv.append(entry[3])
+            if game.position_key() in seen:
+                break
+            seen.add(game.position_key())
+        game.rollback(mark)
+        return pv
+
+    # Iterative deepening over `moves` (default: all legal) until `depth` or `seconds` runs out
+    def search(self, game, depth=None, seconds=None, moves=None, stop=None):
+        start = time.perf_counter()
+        self.nodes = 0
+        self.iterations = []
+        self.deadline = start + seconds if seconds is not None else None
+        self.stop = stop
+        game = game.copy()
+        # Incremental evaluators follow the private copy through every make/unmake
+        if hasattr(self.evaluate, "attach"):
+            self.evaluate.attach(game)
+        moves = list(moves) if moves is not None else game.legal_moves()
+        if not moves:
+            return SearchResult(None, 0, 0, [], 0, 0.0)
+        best = SearchResult(moves[0], 0, 0, [moves[0]], 0, 0.0)
+        for d in range(1, (depth or MAX_DEPTH) + 1):
+            try:
+                scored = self.search_root(game, moves, d)
+            except SearchTimeout:
+                break
+            moves = [move for _, move in scored]
+            score, move = scored[0]
+            best = SearchResult(move, score, d, self.principal_variation(game, move), self.nodes,
+                                time.perf_counter() - start)
+            self.iterations.append(best)
+            if abs(score) >= WIN - MAX_DEPTH:
+                break
+        best.nodes = self.nodes
+        best.seconds = time.perf_counter() - start
+        return best
+
+
+# Worker entry point for root splitting: search a subset of root moves from an exported state;
+# returns the best result of every completed iteration (just the fallback result if none completed)
+def search_moves(state, moves, depth, seconds):
+    game = logic.GameLogic()
+    game.load_state(state)
+    searcher = Searcher()
+    result = searcher.search(game, depth, seconds, moves)
+    return searcher.iterations or [result]
+
+
+# The deepest iteration of a share at or below `depth`
+def iteration_at(iterations, depth):
+    return [r for r in iterations if r.depth <= depth][-1]
+
+
+class ParallelSearcher:
+    # Root-split search: root moves are dealt round-robin to worker processes
+    def __init__(self, workers=None):
+        self.workers = os.cpu_count() if workers is None else workers
+        self.pool = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    # Best move over all workers; depth is the shallowest depth any worker completed
+    def search(self, game, depth=None, seconds=None):
+        start = time.perf_counter()
+        moves = order_moves(game.legal_moves())
+        if self.pool is None or len(moves) < 2:
+            return Searcher().search(game, depth, seconds, moves)
+        state = game.export_state()
+        shares = [moves[i::self.workers] for i in range(self.workers) if moves[i::self.workers]]
+        shares = list(self.pool.map(search_moves, [state] * len(shares), shares,
+                                    [depth] * len(shares), [seconds] * len(shares)))
+        nodes = sum(iterations[-1].nodes for iterations in shares)
+        # Under a time limit the shares stop at different depths, and scores from different depths
+        # (odd against even above all) do not compare; use the deepest depth every share completed.
+        # A share that proved a win or loss stopped early, but its score holds at any greater depth
+        searched = [iterations for iterations in shares if iterations[-1].depth > 0] or shares
+        open_depths = [iterations[-1].depth for iterations in searched
+                       if abs(iterations[-1].score) < WIN - MAX_DEPTH]
+        common = min(open_depths) if open_depths else max(iterations[-1].depth for iterations in searched)
+        best = max((iteration_at(iterations, common) for iterations in searched), key=lambda r: r.score)
+        return SearchResult(best.move, best.score, common, best.pv, nodes, time.perf_counter() - start)
+
+
+# Time a fixed-depth search with 1..max_workers processes; efficiency = speedup / workers
+def scaling_report(texts, depth, max_workers):
+    rows = []
+    base = None
+    for workers in range(1, max_workers + 1):
+        searcher = ParallelSearcher(workers)
+        try:
+            warmup = logic.GameLogic()
+            warmup.load_position(texts[0])
+            searcher.search(warmup, depth=1)
+            start = time.perf_counter()
+            nodes = 0
+            for text in texts:
+                game = logic.GameLogic()
+                game.load_position(text)
+                nodes += searcher.search(game, depth=depth).nodes
+            elapsed = time.perf_counter() - start
+        finally:
+            searcher.close()
+        base = base or elapsed
+        speedup = base / elapsed
+        rows.append({"workers": workers, "seconds": elapsed, "nodes": nodes,
+                     "speedup": speedup, "efficiency": speedup / workers})
+    return rows
+
+
+def main(argv=None):
+    import bench_logic
+    parser = argparse.ArgumentParser(description="Emberlord alpha-beta search with root splitting")
+    parser.add_argument("--position", default=bench_logic.POSITIONS["midgame"])
+    parser.add_argument("--depth", type=int)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--scaling", action="store_true", help="report speedup from 1 to N workers at --depth")
+    args = parser.parse_args(argv)
+
+    if args.scaling:
+        workers = args.workers or os.cpu_count()
+        for row in scaling_report(list(bench_logic.POSITIONS.values()), args.depth or 4, workers):
+            print(f"workers={row['workers']:<3} {row['seconds']:.2f}s nodes={row['nodes']} "
+                  f"speedup={row['speedup']:.2f} efficiency={row['efficiency'] * 100:.0f}%")
+        return
+    game = logic.GameLogic()
+    game.load_position(args.position)
+    searcher = ParallelSearcher(args.workers)
+    try:
+        result = searcher.search(game, args.depth, None if args.depth else args.seconds)
+    finally:
+        searcher.close()
+    print(result.as_dict())
+
+
+if __name__ == "__main__":
+    main()
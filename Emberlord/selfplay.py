@@ -0,0 +1,99 @@
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import logic
+import results
+import search
+
+POLICIES = ("random", "greedy")
+# Cap on game length; the quiet-move draw rule normally ends games long before
+MAX_PLIES = 600
+
+
+# Pick an action for the side to move: uniformly at random, or the best material swing one ply ahead
+def choose_move(policy, game, rng):
+    moves = game.legal_moves()
+    if policy == "random" or len(moves) == 1:
+        return rng.choice(moves)
+    color = game.current_turn
+    best, best_score = [], None
+    for move in moves:
+        mark = game.checkpoint()
+        game.apply_move(move)
+        score = search.material_eval(game)
+        if game.current_turn != color:
+            score = -score
+        game.rollback(mark)
+        if best_score is None or score > best_score:
+            best, best_score = [move], score
+        elif score == best_score:
+            best.append(move)
+    return rng.choice(best)
+
+
+# Play one game; `timeout_rate` is the chance per turn that the side to move loses a piece to the clock
+def play_game(seed, red="random", blue="random", timeout_rate=0.0, max_plies=MAX_PLIES, size=logic.DEFAULT_SIZE):
+    rng = random.Random(seed)
+    game = logic.GameLogic(size)
+    game.reset_board()
+    recorder = results.GameRecorder(game)
+    while game.result() is None and len(recorder.moves) < max_plies:
+        if game.multi_capture_piece is None and timeout_rate and rng.random() < timeout_rate:
+            piece = rng.choice([p for p in game.pieces if p.color == game.current_turn])
+            recorder.play(('timeout', piece.row, piece.col))
+            continue
+        recorder.play(choose_move(red if game.current_turn == 'red' else blue, game, rng))
+    return recorder.record("selfplay", red, blue, seed)
+
+
+# Worker entry point: play_game with its arguments packed in one tuple
+def play_job(job):
+    return play_game(*job)
+
+
+# Yield finished game records, played on a process pool when workers > 1
+def generate(games, workers=None, seed=0, red="random", blue="random", timeout_rate=0.0, size=logic.DEFAULT_SIZE):
+    workers = os.cpu_count() if workers is None else workers
+    jobs = ((seed + i, red, blue, timeout_rate, MAX_PLIES, size) for i in range(games))
+    if workers <= 1:
+        yield from map(play_job, jobs)
+        return
+    with ProcessPoolExecutor(workers) as pool:
+        yield from pool.map(play_job, jobs, chunksize=32)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Self-play Emberlord games into a results database")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--red", choices=POLICIES, default="random")
+    parser.add_argument("--blue", choices=POLICIES, default="random")
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--size", type=int, choices=logic.BOARD_SIZES, default=logic.DEFAULT_SIZE)
+    parser.add_argument("--db", default="results.db")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    ingest = 0.0
+    with results.ResultsStore(args.db) as store:
+        for record in generate(args.games, args.workers, args.seed, args.red, args.blue, args.timeout_rate,
+                               args.size):
+            t = time.perf_counter()
+            store.add(record)
+            ingest += time.perf_counter() - t
+        t = time.perf_counter()
+        store.flush()
+        ingest += time.perf_counter() - t
+        elapsed = time.perf_counter() - start
+        print(f"{args.games} games in {elapsed:.1f}s ({args.games / elapsed:.0f} games/s), "
+              f"ingest {ingest:.2f}s ({ingest / elapsed * 100:.1f}% of wall time), {store.count()} stored")
+        for row in store.win_rate_by_timeout():
+            print(f"timeout={bool(row['group'])!s:<5} games={row['games']} red={row['red_rate']:.3f} "
+                  f"blue={row['blue_rate']:.3f} draw={row['draw_rate']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+import argparse
+import collections
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import analyze
+import benchutil
+import evaluation
+import logic
+import search
+import selfplay
+
+DEFAULT_PORT = 8765
+# Finished results kept, and for how long (seconds)
+CACHE_SIZE = 10000
+CACHE_TTL = 300.0
+# Searches waiting for a worker per worker process; past this the service answers 503 instead of queueing
+QUEUE_PER_WORKER = 8
+# Search limits; requests may ask for less, never more
+DEFAULT_DEPTH = 4
+MAX_DEPTH = 8
+DEFAULT_SECONDS = 0.5
+MAX_SECONDS = 5.0
+# Latency samples kept per endpoint for the percentiles in /stats
+LATENCY_WINDOW = 10000
+ENDPOINTS = ("/moves", "/evaluate", "/bestmove")
+
+
+class ServiceBusy(Exception):
+    pass
+
+
+class ResultCache:
+    # LRU of finished results with a TTL, plus the computations still in flight:
+    # a request for a key that is already being computed waits for that result instead of starting another
+    def __init__(self, max_entries=CACHE_SIZE, ttl=CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = collections.OrderedDict()
+        self.inflight = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.expired = 0
+        self.evicted = 0
+
+    # Value for `key`, computing it with compute() only if nobody has or is getting it;
+    # returns (value, "hit" | "coalesced" | "miss"). Failures are passed to every waiter and not cached
+    def get(self, key, compute):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1], "hit"
+                del self.entries[key]
+                self.expired += 1
+            future = self.inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self.inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not owner:
+            return future.result(), "coalesced"
+        try:
+            value = compute()
+        except BaseException as e:
+            with self.lock:
+                del self.inflight[key]
+            future.set_exception(e)
+            raise
+        with self.lock:
+            del self.inflight[key]
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evicted += 1
+        future.set_result(value)
+        return value, "miss"
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self.entries),
+                "inflight": len(self.inflight),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "expired": self.expired,
+                "evicted": self.evicted,
+                "hit_rate": self.hits / total if total else 0.0,
+                "shared_rate": (self.hits + self.coalesced) / total if total else 0.0,
+            }
+
+
+class AnalysisService:
+    # Legal moves, evaluation and best move for position texts; searches run on a bounded process pool
+    def __init__(self, workers=None, weights=None, cache_size=CACHE_SIZE, ttl=CACHE_TTL):
+        self.workers = max(1, os.cpu_count() if workers is None else workers)
+        self.pool = ProcessPoolExecutor(self.workers, initializer=analyze.init_worker, initargs=(weights,))
+        self.queue = threading.BoundedSemaphore(self.workers * QUEUE_PER_WORKER)
+        self.cache = ResultCache(cache_size, ttl)
+        # Evaluator objects follow one game at a time, so request threads take turns with it
+        self.evaluate = evaluation.Evaluator.from_file(weights) if weights else search.material_eval
+        self.evaluate_lock = threading.Lock()
+        self.latency = {endpoint: collections.deque(maxlen=LATENCY_WINDOW) for endpoint in ENDPOINTS}
+        self.started = time.monotonic()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    # Answer one request: `params` holds "position" and, for /bestmove, optional "depth" and "seconds".
+    # Raises ValueError for a bad request and ServiceBusy when the search queue is full
+    def handle(self, endpoint, params):
+        start = time.perf_counter()
+        game = logic.GameLogic()
+        game.load_position(str(params.get("position", "")))
+        if endpoint == "/moves":
+            key = (endpoint, game.size, game.position_hash())
+            body, cached = self.cache.get(key, lambda: self.moves(game))
+        elif endpoint == "/evaluate":
+            key = (endpoint, game.size, game.position_hash())
+            body, cached = self.cache.get(key, lambda: self.evaluation(game))
+        else:
+            depth = min(int(params.get("depth", DEFAULT_DEPTH)), MAX_DEPTH)
+            seconds = min(float(params.get("seconds", DEFAULT_SECONDS)), MAX_SECONDS)
+            if depth < 1 or not math.isfinite(seconds) or seconds <= 0:
+                raise ValueError("depth and seconds must be positive numbers")
+            key = (endpoint, game.size, game.position_hash(), depth, seconds)
+            body, cached = self.cache.get(key, lambda: self.best_move(game, depth, seconds))
+        self.latency[endpoint].append(time.perf_counter() - start)
+        return dict(body, size=game.size, hash=f"{key[2]:016x}", cached=cached)
+
+    def moves(self, game):
+        table = game.move_table()
+        return {
+            "turn": game.current_turn,
+            "result": game.result(),
+            "must_capture": table.must_capture,
+            "moves": [logic.move_text(m) for m in game.legal_moves()],
+        }
+
+    # Static evaluation from the side to move's point of view
+    def evaluation(self, game):
+        with self.evaluate_lock:
+            score = self.evaluate(game)
+        return {"turn": game.current_turn, "result": game.result(), "score": score}
+
+    # Search on a worker process; only QUEUE_PER_WORKER searches per worker may wait at once
+    def best_move(self, game, depth, seconds):
+        if not self.queue.acquire(blocking=False):
+            raise ServiceBusy("search queue full")
+        try:
+            record = self.pool.submit(analyze.analyze, (0, game.position_text(), depth, seconds)).result()
+        finally:
+            self.queue.release()
+        record.pop("index")
+        record.pop("position")
+        record.setdefault("result", None)
+        return record
+
+    def stats(self):
+        return {
+            "uptime": round(time.monotonic() - self.started, 1),
+            "workers": self.workers,
+            "cache": self.cache.stats(),
+            "latency": {endpoint: benchutil.summarize(list(samples))
+                        for endpoint, samples in self.latency.items() if samples},
+        }
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    # GET with query parameters or POST with a JSON object; every reply is JSON
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == "/stats":
+            self.reply(200, self.server.service.stats())
+            return
+        self.answer(url.path, {k: v[-1] for k, v in urllib.parse.parse_qs(url.query).items()})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self.reply(400, {"error": "body is not JSON"})
+            return
+        if not isinstance(params, dict):
+            self.reply(400, {"error": "body must be a JSON object"})
+            return
+        self.answer(urllib.parse.urlsplit(self.path).path, params)
+
+    def answer(self, path, params):
+        if path not in ENDPOINTS:
+            self.reply(404, {"error": f"unknown endpoint {path}", "endpoints": list(ENDPOINTS) + ["/stats"]})
+            return
+        try:
+            self.reply(200, self.server.service.handle(path, params))
+        except (TypeError, ValueError) as e:
+            self.reply(400, {"error": str(e)})
+        except ServiceBusy as e:
+            self.reply(503, {"error": str(e)})
+        # A dead worker pool or any other failure still gets a reply instead of a dropped connection
+        except Exception as e:
+            self.reply(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # Keep the console quiet under load; /stats has the numbers
+    def log_message(self, format, *args):
+        pass
+
+
+# HTTP server for `service` on host:port (port 0 picks a free one); call serve_forever() to run it
+def make_server(service, host="127.0.0.1", port=DEFAULT_PORT):
+    server = ThreadingHTTPServer((host, port), RequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+# Positions at the start of turns of a few random games, to replay against a running service
+def sample_positions(count, seed=0):
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game = logic.GameLogic()
+        game.reset_board()
+        while game.result() is None and len(positions) < count and len(game.history) < selfplay.MAX_PLIES:
+            if game.multi_capture_piece is None:
+                positions.append(game.position_text())
+            game.apply_move(selfplay.choose_move("random", game, rng))
+    return positions
+
+
+# Send `requests` requests for randomly drawn `positions` from `clients` threads; client-side latency summary
+def load_test(url, positions, requests=2000, clients=16, endpoint="/bestmove", depth=DEFAULT_DEPTH,
+              seconds=DEFAULT_SECONDS, seed=0):
+    rng = random.Random(seed)
+    bodies = [json.dumps({"position": rng.choice(positions), "depth": depth, "seconds": seconds}).encode()
+              for _ in range(requests)]
+
+    def send(body):
+        start = time.perf_counter()
+        request = urllib.request.Request(url + endpoint, body, {"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        return status, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        replies = list(pool.map(send, bodies))
+    elapsed = time.perf_counter() - start
+    statuses = collections.Counter(status for status, _ in replies)
+    return dict(benchutil.summarize([latency for _, latency in replies]), seconds=elapsed,
+                rate=requests / elapsed, statuses=dict(statuses))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Emberlord analysis service (HTTP/JSON)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--weights", help="evaluation weights file (default: material count)")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE)
+    parser.add_argument("--ttl", type=float, default=CACHE_TTL)
+    parser.add_argument("--load-test", action="store_true",
+                        help="load-test --url, or a service started in this process when no --url is given")
+    parser.add_argument("--url", help="running service to load-test, e.g. http://127.0.0.1:8765")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--distinct", type=int, default=200, help="distinct positions in the load test")
+    parser.add_argument("--endpoint", choices=ENDPOINTS, default="/bestmove")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH)
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SECONDS)
+    args = parser.parse_args(argv)
+
+    if not args.load_test:
+        service = AnalysisService(args.workers, args.weights, args.cache_size, args.ttl)
+        server = make_server(service, args.host, args.port)
+        print(f"serving on http://{args.host}:{server.server_port} with {service.workers} workers", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            service.close()
+        return
+
+    service = server = None
+    url = args.url
+    if url is None:
+        service = AnalysisService(args.workers, args.weights, args.cache_size, args.ttl)
+        server = make_server(service, args.host, 0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://{args.host}:{server.server_port}"
+    try:
+        stats = load_test(url.rstrip("/"), sample_positions(args.distinct), args.requests, args.clients,
+                          args.endpoint, args.depth, args.seconds)
+        print(f"{args.requests} requests from {args.clients} clients in {stats['seconds']:.1f}s "
+              f"({stats['rate']:.0f} req/s) p50={stats['p50_ms']:.1f}ms p90={stats['p90_ms']:.1f}ms "
+              f"p99={stats['p99_ms']:.1f}ms statuses={stats['statuses']}")
+        with urllib.request.urlopen(url.rstrip("/") + "/stats") as response:
+            print(json.dumps(json.loads(response.read()), indent=2))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import asyncio
+from collections import deque
+
+# How many deltas are sent between two full snapshots
+SNAPSHOT_INTERVAL = 32
+# Default number of undelivered messages a subscriber may hold before it is cut off
+MAX_PENDING = 256
+
+
+# Return (row, col, color, king, power_up) for a piece; used to diff positions between publishes
+def piece_state(piece):
+    return (piece.row, piece.col, piece.color, piece.king, piece.power_up)
+
+
+# Schedule `callback` on the running asyncio loop, or run it straight away without one
+def default_scheduler(callback):
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        callback()
+        return
+    loop.call_soon(callback)
+
+
+class Subscriber:
+    # One spectator connection: a bounded message queue plus backpressure state.
+    # With `on_batch` the queue is pushed to the callback on a later scheduler pass instead of being polled
+    def __init__(self, feed, max_pending=MAX_PENDING, on_batch=None):
+        self.feed = feed
+        self.max_pending = max_pending
+        self.on_batch = on_batch
+        self.queue = deque()
+        self.lagging = False
+        self.dropped = 0
+        # seq of the newest message handed to this subscriber; anything older is a duplicate
+        self.seq = 0
+        self.push_scheduled = False
+
+    # Accept a batch from the feed; a full queue marks the subscriber as lagging
+    def offer(self, batch):
+        if self.lagging:
+            self.dropped += len(batch)
+            return
+        # A catch-up may already hold messages that were still waiting for the feed's flush
+        batch = [msg for msg in batch if msg["seq"] > self.seq]
+        if not batch:
+            return
+        if len(self.queue) + len(batch) > self.max_pending:
+            self.dropped += len(self.queue) + len(batch)
+            self.queue.clear()
+            self.lagging = True
+        else:
+            self.queue.extend(batch)
+            self.seq = batch[-1]["seq"]
+        if self.on_batch is not None and not self.push_scheduled:
+            self.push_scheduled = True
+            self.feed.scheduler(self.push)
+
+    # Return every queued message; a lagging subscriber is resynced with a fresh snapshot
+    def drain(self):
+        if self.lagging:
+            self.lagging = False
+            self.queue.clear()
+            messages = self.feed.catch_up()
+            if messages:
+                self.seq = messages[-1]["seq"]
+            return messages
+        messages = list(self.queue)
+        self.queue.clear()
+        return messages
+
+    # Hand the queue to the push callback; a callback that falls behind is cut off and resynced like a poller
+    def push(self):
+        self.push_scheduled = False
+        messages = self.drain()
+        if messages:
+            self.on_batch(messages)
+
+    # Stop receiving messages from the feed
+    def close(self):
+        self.feed.unsubscribe(self)
+
+
+class SpectatorFeed:
+    # Turns GameLogic changes into compact deltas and fans them out to subscribers
+    def __init__(self, scheduler=default_scheduler, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.scheduler = scheduler
+        self.snapshot_interval = snapshot_interval
+        self.subscribers = []
+        self.seq = 0
+        self.last_snapshot = None
+        self.since_snapshot = []
+        self.pending = []
+        self.flush_scheduled = False
+        self.prev_states = None
+        self.prev_turn = None
+
+    # Register a new spectator; late joiners start from the latest snapshot and its deltas
+    def subscribe(self, max_pending=MAX_PENDING, on_batch=None):
+        sub = Subscriber(self, max_pending, on_batch)
+        self.subscribers.append(sub)
+        if self.last_snapshot is not None:
+            sub.offer(self.catch_up())
+        return sub
+
+    # Remove a spectator from the fan-out list
+    def unsubscribe(self, sub):
+        if sub in self.subscribers:
+            self.subscribers.remove(sub)
+
+    # Latest snapshot followed by every delta published after it
+    def catch_up(self):
+        if self.last_snapshot is None:
+            return []
+        return [self.last_snapshot] + self.since_snapshot
+
+    # Build a full snapshot message of the current position
+    def snapshot(self, logic, clock=None):
+        return {
+            "t": "s",
+            "seq": self.seq,
+            "turn": logic.current_turn,
+            "pieces": [list(piece_state(p)) for p in logic.pieces],
+            "captured": [logic.red_captured, logic.blue_captured],
+            "clock": clock,
+        }
+
+    # Diff the previous and current positions into a delta message
+    def delta(self, logic, clock=None):
+        moves, captured, promoted = [], [], []
+        burned = None
+        current = {p: piece_state(p) for p in logic.pieces}
+        for piece, old in self.prev_states.items():
+            new = current.get(piece)
+            if new is None:
+                captured.append([old[0], old[1]])
+                continue
+            if new[:2] != old[:2]:
+                moves.append([old[0], old[1], new[0], new[1]])
+            if new[3] and not old[3]:
+                promoted.append([new[0], new[1]])
+            if old[4] and not new[4]:
+                burned = [logic.last_burn_col, new[0], new[1]]
+        msg = {"t": "d", "seq": self.seq}
+        if moves:
+            msg["mv"] = moves
+        if captured:
+            msg["x"] = captured
+        if burned is not None:
+            msg["b"] = burned
+        if promoted:
+            msg["k"] = promoted
+        if logic.current_turn != self.prev_turn:
+            msg["turn"] = logic.current_turn
+        if clock is not None:
+            msg["c"] = clock
+        return msg, current
+
+    # Record the state of `logic` after a change and queue it for the next fan-out
+    def publish(self, logic, clock=None, full=False):
+        self.seq += 1
+        reset = self.prev_states is None or not any(p in self.prev_states for p in logic.pieces)
+        if reset or full or len(self.since_snapshot) >= self.snapshot_interval:
+            msg = self.snapshot(logic, clock)
+            self.last_snapshot = msg
+            self.since_snapshot = []
+            self.prev_states = {p: piece_state(p) for p in logic.pieces}
+        else:
+            msg, self.prev_states = self.delta(logic, clock)
+            self.since_snapshot.append(msg)
+        self.prev_turn = logic.current_turn
+        self.pending.append(msg)
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.scheduler(self.flush)
+        return msg
+
+    # Deliver every message queued during this event-loop tick as one batch
+    def flush(self):
+        self.flush_scheduled = False
+        if not self.pending:
+            return
+        batch = self.pending
+        self.pending = []
+        for sub in list(self.subscribers):
+            sub.offer(batch)
+
+    # Number of subscribers that were cut off and are waiting for a resync
+    def lagging_count(self):
+        return sum(1 for sub in self.subscribers if sub.lagging)
+
+
+# Rebuild a board dict {(row, col): [color, king, power_up]} from a stream of messages
+def apply_messages(board, messages):
+    for msg in messages:
+        if msg["t"] == "s":
+            board.clear()
+            for row, col, color, king, power_up in msg["pieces"]:
+                board[(row, col)] = [color, king, power_up]
+            continue
+        for row, col in msg.get("x", []):
+            board.pop((row, col), None)
+        moved = [(board.pop((fr, fc)), tr, tc) for fr, fc, tr, tc in msg.get("mv", [])]
+        for state, row, col in moved:
+            board[(row, col)] = state
+        for row, col in msg.get("k", []):
+            board[(row, col)][1] = True
+            board[(row, col)][2] = True
+        if "b" in msg:
+            board[(msg["b"][1], msg["b"][2])][2] = False
+    return board
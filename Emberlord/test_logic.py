@@ -0,0 +1,208 @@
+import random
+import pytest
+import logic
+
+DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def new_game(size=logic.DEFAULT_SIZE):
+    game = logic.GameLogic(size)
+    game.reset_board()
+    return game
+
+
+def board_of(game):
+    return {(p.row, p.col): (p.color, p.king) for p in game.pieces}
+
+
+# Reference rules: a brute-force port of the original GameLogic.move_piece/piece_has_capture that works on
+# a plain {(row, col): (color, king)} dict, so the move tables, Zobrist keys and undo log are checked
+# against something that shares none of their code
+def ref_inside(size, row, col):
+    return 0 <= row < size and 0 <= col < size
+
+
+def ref_has_capture(board, size, square):
+    color, king = board[square]
+    for dr, dc in DIRECTIONS:
+        r, c = square[0] + dr, square[1] + dc
+        if king:
+            while ref_inside(size, r, c) and (r, c) not in board:
+                r, c = r + dr, c + dc
+        landing = (r + dr, c + dc)
+        if ((r, c) in board and board[(r, c)][0] != color and ref_inside(size, *landing)
+                and landing not in board):
+            return True
+    return False
+
+
+# Captured square for a legal move (None for a plain move), False for an illegal one
+def ref_try_move(board, size, turn, multi, must_capture, start, end):
+    piece = board.get(start)
+    if piece is None or piece[0] != turn or end in board:
+        return False
+    if multi is not None and start != multi:
+        return False
+    dr, dc = end[0] - start[0], end[1] - start[1]
+    if piece[1]:
+        if abs(dr) != abs(dc) or dr == 0:
+            return False
+        step_r, step_c = (1 if dr > 0 else -1), (1 if dc > 0 else -1)
+        between = [(start[0] + i * step_r, start[1] + i * step_c) for i in range(1, abs(dr))]
+        between = [square for square in between if square in board]
+        if not between:
+            return False if must_capture else None
+        if len(between) == 1 and board[between[0]][0] != turn:
+            return between[0]
+        return False
+    if abs(dr) == 1 and abs(dc) == 1:
+        return None if not must_capture and dr == (1 if turn == 'red' else -1) else False
+    if abs(dr) == 2 and abs(dc) == 2:
+        mid = (start[0] + dr // 2, start[1] + dc // 2)
+        if mid in board and board[mid][0] != turn:
+            return mid
+    return False
+
+
+# Every (start, end, captured) the reference allows, found by trying all square pairs
+def ref_moves(board, size, turn, multi):
+    must_capture = any(ref_has_capture(board, size, square) for square, (color, _) in board.items()
+                       if color == turn)
+    moves = set()
+    for start in board:
+        for end in ((r, c) for r in range(size) for c in range(size)):
+            captured = ref_try_move(board, size, turn, multi, must_capture, start, end)
+            if captured is not False:
+                moves.add((start, end, captured))
+    return moves
+
+
+# Board, side to move and multi-capture square after a legal reference move
+def ref_apply(board, size, turn, start, end, captured):
+    board = dict(board)
+    color, king = board.pop(start)
+    if captured is not None:
+        del board[captured]
+    if not king and end[0] == (size - 1 if color == 'red' else 0):
+        king = True
+    board[end] = (color, king)
+    if captured is not None and ref_has_capture(board, size, end):
+        return board, turn, end
+    return board, 'red' if turn == 'blue' else 'blue', None
+
+
+def ref_winner(board, turn, moves):
+    colors = [color for color, _ in board.values()]
+    if 'red' not in colors:
+        return "Blue Wins!"
+    if 'blue' not in colors:
+        return "Red Wins!"
+    if not moves:
+        return f"{turn.capitalize()} is stuck! Opponent Wins!"
+    return None
+
+
+# 12 random games of up to 120 plies per size: legal_moves, apply_move and winner_check agree with the reference
+@pytest.mark.parametrize("size", logic.BOARD_SIZES)
+def test_engine_matches_brute_force_reference(size):
+    for seed in range(12):
+        rng = random.Random(seed)
+        game = new_game(size)
+        # Draw rules are newer than the reference; only repetition can end these games early
+        game.quiet_move_limit = 10 ** 9
+        for _ in range(120):
+            board = board_of(game)
+            turn = game.current_turn
+            multi = game.multi_capture_piece
+            multi = (multi.row, multi.col) if multi is not None else None
+            expected = ref_moves(board, size, turn, multi)
+            moves = game.legal_moves()
+            assert {((m[1], m[2]), (m[3], m[4])) for m in moves if m[0] == 'move'} == \
+                {(start, end) for start, end, _ in expected}
+            if game.draw_reason() is not None:
+                break
+            assert game.winner_check() == ref_winner(board, turn, expected)
+            if game.result() is not None:
+                break
+            move = rng.choice(moves)
+            assert game.apply_move(move)
+            if move[0] == 'move':
+                start, end = (move[1], move[2]), (move[3], move[4])
+                captured = next(c for s, e, c in expected if (s, e) == (start, end))
+                piece = game.multi_capture_piece
+                assert (board_of(game), game.current_turn, (piece.row, piece.col) if piece else None) == \
+                    ref_apply(board, size, turn, start, end, captured)
+
+
+# Everything rollback must restore, including what the cached move tables are keyed on
+def snapshot(game):
+    multi = game.multi_capture_piece
+    return (game.position_text(), game.position_hash(), game.position_key(), list(game.history),
+            dict(game.repetitions), game.red_captured, game.blue_captured, game.quiet_moves,
+            (multi.row, multi.col) if multi else None, sorted(game.legal_moves()))
+
+
+# Random walks undone one checkpoint at a time come back to every earlier state, on every size
+@pytest.mark.parametrize("size", logic.BOARD_SIZES)
+def test_rollback_round_trip(size):
+    rng = random.Random(size)
+    for _ in range(6):
+        game = new_game(size)
+        marks = []
+        for _ in range(80):
+            if game.result() is not None:
+                break
+            marks.append((game.checkpoint(), snapshot(game)))
+            assert game.apply_move(rng.choice(game.legal_moves()))
+        while marks:
+            mark, before = marks.pop()
+            game.rollback(mark)
+            assert snapshot(game) == before
+            # A fresh game in the same position agrees with whatever the rolled-back game has cached
+            fresh = logic.GameLogic(size)
+            fresh.load_state(game.export_state())
+            assert sorted(fresh.legal_moves()) == sorted(game.legal_moves())
+            assert fresh.position_hash() == game.position_hash()
+
+
+@pytest.mark.parametrize("size", [10, 12])
+def test_large_board_setup(size):
+    game = new_game(size)
+    rows = game.geometry.men_rows
+    assert game.counts == {'red': rows * size // 2, 'blue': rows * size // 2}
+    assert all((p.row + p.col) % 2 == 1 for p in game.pieces)
+    assert {p.row for p in game.pieces if p.color == 'red'} == set(range(rows))
+    assert {p.row for p in game.pieces if p.color == 'blue'} == set(range(size - rows, size))
+    # Blue opens with single forward steps from its front row only
+    moves = game.legal_moves()
+    assert moves and all(m[0] == 'move' and m[1] == size - rows and m[3] == m[1] - 1 for m in moves)
+
+    loaded = logic.GameLogic()
+    loaded.load_position(game.position_text())
+    assert loaded.size == size
+    assert loaded.position_text() == game.position_text()
+    assert loaded.position_hash() == game.position_hash()
+
+
+# The same pieces on different board sizes never share a hash, so tables and caches keyed on it stay apart
+def test_position_hash_includes_size():
+    hashes = set()
+    for size in logic.BOARD_SIZES:
+        game = logic.GameLogic(size)
+        game.load_position('blue:' + '/'.join('.' * size if r != 1 else '.b' + '.' * (size - 2)
+                                              for r in range(size)))
+        hashes.add(game.position_hash())
+    assert len(hashes) == len(logic.BOARD_SIZES)
+
+
+# Men crowned on the far row of a large board become flying kings there, not on row 7
+@pytest.mark.parametrize("size", [10, 12])
+def test_promotion_on_far_row(size):
+    rows = ['.' * size for _ in range(size)]
+    rows[size - 2] = '.' * 3 + 'r' + '.' * (size - 4)
+    rows[0] = 'b' + '.' * (size - 1)
+    game = logic.GameLogic(size)
+    game.load_position('red:' + '/'.join(rows))
+    assert game.apply_move(('move', size - 2, 3, size - 1, 4))
+    piece = game.get_piece(size - 1, 4)
+    assert piece.king and piece.power_up
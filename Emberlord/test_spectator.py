@@ -0,0 +1,79 @@
+import logic
+import spectator
+
+
+# Scheduler that holds callbacks until the test runs them, like one pending event-loop pass
+class Deferred:
+    def __init__(self):
+        self.callbacks = []
+
+    def __call__(self, callback):
+        self.callbacks.append(callback)
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+def new_game():
+    game = logic.GameLogic()
+    game.reset_board()
+    return game
+
+
+def board_of(game):
+    return {(p.row, p.col): [p.color, p.king, p.power_up] for p in game.pieces}
+
+
+def test_late_join_between_publish_and_flush():
+    tick = Deferred()
+    feed = spectator.SpectatorFeed(scheduler=tick)
+    game = new_game()
+    feed.publish(game, full=True)
+    tick.run()
+    game.apply_move(game.legal_moves()[0])
+    feed.publish(game)
+    sub = feed.subscribe()
+    tick.run()
+    messages = sub.drain()
+    assert [m["seq"] for m in messages] == [1, 2]
+    assert spectator.apply_messages({}, messages) == board_of(game)
+
+
+def test_resync_between_publish_and_flush():
+    tick = Deferred()
+    feed = spectator.SpectatorFeed(scheduler=tick)
+    game = new_game()
+    sub = feed.subscribe(max_pending=2)
+    feed.publish(game, full=True)
+    tick.run()
+    board = spectator.apply_messages({}, sub.drain())
+    for _ in range(3):
+        game.apply_move(game.legal_moves()[0])
+        feed.publish(game)
+        tick.run()
+    assert sub.lagging
+    game.apply_move(game.legal_moves()[0])
+    feed.publish(game)
+    spectator.apply_messages(board, sub.drain())
+    tick.run()
+    spectator.apply_messages(board, sub.drain())
+    assert board == board_of(game)
+
+
+def test_push_subscriber_is_cut_off_and_resynced():
+    tick = Deferred()
+    feed = spectator.SpectatorFeed(scheduler=tick)
+    game = new_game()
+    received = []
+    feed.subscribe(max_pending=2, on_batch=received.extend)
+    feed.publish(game, full=True)
+    for _ in range(3):
+        game.apply_move(game.legal_moves()[0])
+        feed.publish(game)
+    tick.run()
+    assert received == []
+    tick.run()
+    assert received[0]["t"] == "s"
+    assert spectator.apply_messages({}, received) == board_of(game)
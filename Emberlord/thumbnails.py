@@ -0,0 +1,170 @@
+import argparse
+import collections
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtGui import QGuiApplication, QImage, QPainter
+from PyQt6.QtCore import Qt
+import logic
+import results
+import ui
+
+# Thumbnail edge in pixels
+THUMB_PIX = 160
+# Thumbnails in flight per worker thread; keeps memory flat on very large archives
+WINDOW_PER_WORKER = 8
+
+
+class ThumbnailRenderer:
+    # Paints positions into QImages with the Board look (background, square colours, sprites), no window needed.
+    # Everything shared is built here on the calling thread; render() only reads it, so any number of
+    # threads may call it at once
+    def __init__(self, pix=THUMB_PIX):
+        self.pix = pix
+        assets = ui.shared_assets()
+        self.background = assets.image(ui.BACKGROUND_IMAGE, pix, pix, Qt.AspectRatioMode.IgnoreAspectRatio)
+        self.grids = {}
+        self.sprites = {}
+        for size in logic.BOARD_SIZES:
+            grid = self.grids[size] = ui.board_grid(size, pix, 0, 0)
+            sq = grid.square_size
+            self.sprites[size] = {name: assets.image(path, sq, sq) for name, path in ui.PIECE_IMAGES.items()}
+
+    # A board_snapshot as a pix x pix QImage
+    def render(self, snapshot):
+        size, pieces = snapshot
+        grid = self.grids[size]
+        sprites = self.sprites[size]
+        image = QImage(self.pix, self.pix, QImage.Format.Format_ARGB32_Premultiplied)
+        painter = QPainter(image)
+        painter.drawImage(0, 0, self.background)
+        for rect, color in grid.cells:
+            painter.fillRect(rect, color)
+        for row, col, name in pieces:
+            painter.drawImage(grid.rects[(row, col)], sprites[name])
+        painter.end()
+        return image
+
+
+# What a thumbnail needs of a position: (size, ((row, col, sprite name), ...)); plain data, cheap to hand to a thread
+def board_snapshot(game):
+    return game.size, tuple((p.row, p.col, f"{p.color}_{'king' if p.king else 'piece'}") for p in game.pieces)
+
+
+# Replay a stored game once and yield (ply, snapshot) for every requested ply
+# (None = the final position; negative counts back from the end; past the end = the final position)
+def record_snapshots(record, plies):
+    moves = results.record_moves(record)
+    targets = {}
+    for ply in plies:
+        at = len(moves) if ply is None else ply if ply >= 0 else len(moves) + ply
+        targets.setdefault(max(0, min(len(moves), at)), []).append(ply)
+    game = results.record_game(record)
+    last = max(targets)
+    for index in range(last + 1):
+        if index in targets:
+            snapshot = board_snapshot(game)
+            for ply in targets.pop(index):
+                yield ply, snapshot
+        if index == last or not game.apply_move(moves[index]):
+            break
+    # An illegal move cuts the record short; later plies show the last legal position
+    if targets:
+        snapshot = board_snapshot(game)
+        for requested in targets.values():
+            for ply in requested:
+                yield ply, snapshot
+
+
+# Output file for one game at one ply
+def thumbnail_path(out_dir, record, ply):
+    name = str(record["id"]) if ply is None else f"{record['id']}-{ply}"
+    return os.path.join(out_dir, name + ".png")
+
+
+# Paint and save one (snapshot, path) job; returns whether the PNG was written
+def render_job(renderer, job):
+    snapshot, path = job
+    return renderer.render(snapshot).save(path, "PNG")
+
+
+# Run render_job over `jobs` on a thread pool, yielding the results in order with at most `window` pending.
+# The jobs carry finished snapshots, so the pool only paints and encodes, which happens inside Qt
+def ordered_renders(renderer, jobs, workers, window):
+    if workers <= 1:
+        for job in jobs:
+            yield render_job(renderer, job)
+        return
+    with ThreadPoolExecutor(workers) as pool:
+        pending = collections.deque()
+        for job in jobs:
+            pending.append(pool.submit(render_job, renderer, job))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# Thumbnail every record at every ply in `plies` (None = final position) into `out_dir`;
+# files that already exist are kept unless `overwrite`
+def run(records, out_dir, plies=(None,), pix=THUMB_PIX, workers=None, overwrite=False):
+    workers = os.cpu_count() if workers is None else workers
+    os.makedirs(out_dir, exist_ok=True)
+    renderer = ThumbnailRenderer(pix)
+    skipped = 0
+
+    # Each record is replayed once, here on the producer side, for all of its missing plies
+    def jobs():
+        nonlocal skipped
+        for record in records:
+            paths = {}
+            for ply in plies:
+                path = thumbnail_path(out_dir, record, ply)
+                if not overwrite and os.path.exists(path):
+                    skipped += 1
+                else:
+                    paths[ply] = path
+            if paths:
+                for ply, snapshot in record_snapshots(record, list(paths)):
+                    yield snapshot, paths[ply]
+
+    start = time.perf_counter()
+    written = failed = 0
+    for ok in ordered_renders(renderer, jobs(), workers, max(1, workers) * WINDOW_PER_WORKER):
+        if ok:
+            written += 1
+        else:
+            failed += 1
+    return {"written": written, "failed": failed, "skipped": skipped, "seconds": time.perf_counter() - start}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render PNG thumbnails of stored Emberlord games")
+    parser.add_argument("--db", default="results.db")
+    parser.add_argument("--where", default="1", help="SQL filter on the games table")
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--ply", type=int, action="append",
+                        help="render the position after this many plies (repeatable; default: final position)")
+    parser.add_argument("--out", default="thumbnails")
+    parser.add_argument("--pix", type=int, default=THUMB_PIX)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args(argv)
+
+    db = os.path.abspath(args.db)
+    out = os.path.abspath(args.out)
+    # No window is ever shown; ui.py loads its images from paths relative to this folder
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    app = QGuiApplication(sys.argv)
+    with results.ResultsStore(db) as store:
+        stats = run(store.games(args.where, limit=args.limit), out, args.ply or [None], args.pix,
+                    args.workers, args.overwrite)
+    rate = stats["written"] / stats["seconds"] if stats["seconds"] else 0.0
+    print(f"{stats['written']} thumbnails in {stats['seconds']:.1f}s ({rate:.0f}/s), {stats['skipped']} already there, "
+          f"{stats['failed']} failed -> {out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
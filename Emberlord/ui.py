@@ -2,13 +2,17 @@ import sys
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QPushButton, QStackedWidget, QLabel, QVBoxLayout, QGraphicsBlurEffect, QFileDialog, QInputDialog
 )
-from PyQt6.QtGui import QPainter, QColor, QPixmap, QIcon, QMovie
-from PyQt6.QtCore import Qt, QPropertyAnimation, pyqtProperty, QTimer, QSize, QUrl
+from PyQt6.QtGui import QPainter, QColor, QPixmap, QIcon, QMovie, QImage
+from PyQt6.QtCore import Qt, QPropertyAnimation, pyqtProperty, pyqtSignal, QTimer, QSize, QUrl, QRect
 from PyQt6.QtMultimedia import QSoundEffect
+import autosave
 import logic
+import spectator
 import random
+import time
 
 WINDOW_SIZE = 720
+# Default squares per side; logic.BOARD_SIZES lists the others
 BOARD_SIZE = 8
 Y_OFFSET = 50
 BOARD_PIX = WINDOW_SIZE - 2 * Y_OFFSET
@@ -18,11 +22,194 @@ SQUARE_SIZE = BOARD_PIX // BOARD_SIZE
 LIGHT_COLOR = QColor(245, 230, 200)
 DARK_COLOR = QColor(130, 50, 30)
 HIGHLIGHT_COLOR = QColor(0, 255, 0, 100)
+# Width of the pulsing frame around pieces with a forced capture
+FRAME_THICKNESS = 6
+# Board and piece artwork, relative to the Emberlord folder
+BACKGROUND_IMAGE = r'images/bg.png'
+LAVA_ANIMATION = r'images/lava tile.gif'
+# One animation clock tick, and the half-period of the forced-capture pulse
+FRAME_MS = 100
+FLASH_MS = 500
+PIECE_IMAGES = {
+    'red_piece': r'images/red piece.png',
+    'blue_piece': r'images/blue piece.png',
+    'red_king': r'images/red king.png',
+    'blue_king': r'images/blue king.png',
+}
+
+
+class AssetCache:
+    # Images shared by every board in the process: each file is decoded once and each scaled size kept once
+    def __init__(self):
+        self.images = {}
+        self.scaled = {}
+        self.animations = {}
+        self.raw = {}
+
+    # Pixmap for `path`, scaled to width x height when given
+    def pixmap(self, path, width=None, height=None, mode=Qt.AspectRatioMode.KeepAspectRatio):
+        image = self.images.get(path)
+        if image is None:
+            image = self.images[path] = QPixmap(path)
+        if width is None:
+            return image
+        key = (path, width, height, mode)
+        scaled = self.scaled.get(key)
+        if scaled is None:
+            scaled = self.scaled[key] = image.scaled(width, height, mode)
+        return scaled
+
+    # QImage for `path`, smoothly scaled when a size is given; unlike pixmaps these can be painted from
+    # worker threads, but they must be fetched on the main thread first (the cache itself is not locked)
+    def image(self, path, width=None, height=None, mode=Qt.AspectRatioMode.KeepAspectRatio):
+        image = self.raw.get(path)
+        if image is None:
+            image = self.raw[path] = QImage(path)
+        if width is None:
+            return image
+        key = ('image', path, width, height, mode)
+        scaled = self.scaled.get(key)
+        if scaled is None:
+            scaled = self.scaled[key] = image.scaled(width, height, mode, Qt.TransformationMode.SmoothTransformation)
+        return scaled
+
+    # Every frame of an animated image (scaled when a size is given) and the frame delay in ms
+    def frames(self, path, width=None, height=None, mode=Qt.AspectRatioMode.KeepAspectRatioByExpanding):
+        decoded = self.animations.get(path)
+        if decoded is None:
+            movie = QMovie(path)
+            movie.jumpToFrame(0)
+            delay = movie.nextFrameDelay() or 100
+            frames = [movie.currentPixmap()]
+            while movie.jumpToNextFrame() and movie.currentFrameNumber() != 0:
+                frames.append(movie.currentPixmap())
+            decoded = self.animations[path] = (frames, delay)
+        if width is None:
+            return decoded
+        key = (path, width, height, mode)
+        scaled = self.scaled.get(key)
+        if scaled is None:
+            scaled = self.scaled[key] = ([frame.scaled(width, height, mode) for frame in decoded[0]], decoded[1])
+        return scaled
+
+
+# The process-wide AssetCache (created on first use, after the QApplication)
+_assets = None
+
+
+# Return the shared AssetCache
+def shared_assets():
+    global _assets
+    if _assets is None:
+        _assets = AssetCache()
+    return _assets
+
+
+class AnimationClock:
+    # The single timer behind every board's lava animation and capture pulse; only boards that are
+    # on screen are advanced. Boards need is_onscreen() and advance(now)
+    def __init__(self, interval=FRAME_MS):
+        self.boards = []
+        self.started = time.monotonic()
+        self.timer = QTimer()
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.tick)
+        self.advanced = 0
+        self.skipped = 0
+
+    def add(self, board):
+        self.boards.append(board)
+        self.start()
+
+    def remove(self, board):
+        self.boards.remove(board)
+
+    def start(self):
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    # Milliseconds since the clock was created; every animation is timed from this
+    def now(self):
+        return int((time.monotonic() - self.started) * 1000)
+
+    # Pulse phase shared by all forced-capture frames
+    def flash_on(self, now):
+        return (now // FLASH_MS) % 2 == 0
+
+    # Advance visible boards; offscreen ones cost nothing until they scroll back into view
+    def tick(self):
+        now = self.now()
+        for board in self.boards:
+            if board.is_onscreen():
+                board.advance(now)
+                self.advanced += 1
+            else:
+                self.skipped += 1
+
+
+# The process-wide AnimationClock (created on first use, after the QApplication)
+_clock = None
+
+
+# Return the shared AnimationClock
+def shared_clock():
+    global _clock
+    if _clock is None:
+        _clock = AnimationClock()
+    return _clock
+
+
+class BoardGrid:
+    # Pixel geometry for one board size, computed once: square rects and colours,
+    # forced-capture frames and burn columns, so painting and clicks never redo the arithmetic
+    def __init__(self, size, board_pix=BOARD_PIX, origin_x=(1024 - WINDOW_SIZE) // 2, origin_y=Y_OFFSET):
+        self.size = size
+        self.square_size = sq = board_pix // size
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        t = max(1, FRAME_THICKNESS * sq // SQUARE_SIZE)
+        self.rects = {}
+        self.cells = []
+        self.frames = {}
+        for row in range(size):
+            for col in range(size):
+                x = self.origin_x + col * sq
+                y = self.origin_y + row * sq
+                rect = QRect(x, y, sq, sq)
+                self.rects[(row, col)] = rect
+                self.cells.append((rect, LIGHT_COLOR if (row + col) % 2 == 0 else DARK_COLOR))
+                self.frames[(row, col)] = (QRect(x, y, sq, t), QRect(x, y + sq - t, sq, t),
+                                           QRect(x, y + t, t, sq - 2 * t), QRect(x + sq - t, y + t, t, sq - 2 * t))
+        self.columns = [QRect(self.origin_x + col * sq, self.origin_y, sq, sq * size) for col in range(size)]
+
+    # (row, col) under the widget point (x, y); may lie off the board
+    def square_at(self, x, y):
+        return (int(y - self.origin_y) // self.square_size, int(x - self.origin_x) // self.square_size)
+
+
+# One shared BoardGrid per size and placement, built on first use
+_grids = {}
+
+
+# Return the BoardGrid for `size` (by default the full-window board)
+def board_grid(size, board_pix=BOARD_PIX, origin_x=(1024 - WINDOW_SIZE) // 2, origin_y=Y_OFFSET):
+    key = (size, board_pix, origin_x, origin_y)
+    grid = _grids.get(key)
+    if grid is None:
+        grid = _grids[key] = BoardGrid(size, board_pix, origin_x, origin_y)
+    return grid
 
 
 class Board(QWidget):
+    # The computer's turn from its worker thread: (position key it was thought for, moves or None).
+    # Emitted off the GUI thread, so it arrives queued in play_computer_turn
+    computer_turn_ready = pyqtSignal(object, object)
+
     # Initialize board widget: load graphics, timers and game state
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, size=BOARD_SIZE):
         super().__init__(parent)
         self.setWindowTitle("Emberlord")
         self.setFixedSize(1024, WINDOW_SIZE)
@@ -33,12 +220,9 @@ class Board(QWidget):
         self.board_width = 512  # For example, 8 squares * 64px each
         self.board_height = 512
 
-        # Board graphics
-        self.board_bg = QPixmap(r'images/bg.png').scaled(1024, WINDOW_SIZE)
-        self.red_piece = QPixmap(r'images/red piece.png').scaled(SQUARE_SIZE, SQUARE_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
-        self.blue_piece = QPixmap(r'images/blue piece.png').scaled(SQUARE_SIZE, SQUARE_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
-        self.red_king = QPixmap(r'images/red king.png').scaled(SQUARE_SIZE, SQUARE_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
-        self.blue_king = QPixmap(r'images/blue king.png').scaled(SQUARE_SIZE, SQUARE_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
+        # Board graphics come from the shared cache; piece images are scaled to the square size in set_board_size
+        self.assets = shared_assets()
+        self.board_bg = self.assets.pixmap(BACKGROUND_IMAGE, 1024, WINDOW_SIZE, Qt.AspectRatioMode.IgnoreAspectRatio)
 
         self.pieces = []
         self.highlight_moves = []
@@ -46,11 +230,17 @@ class Board(QWidget):
         self.random_burn_pos = None
         self.active_burn_column = None
         self.awaiting_burn = False
+        self.spectator_feed = None
+        self.computer = None
+        self.computer_thinking = False
+        self.computer_turn_ready.connect(self.play_computer_turn)
+        self.autosave = None
 
         # Game logic
-        self.logic = logic.GameLogic()
+        self.logic = logic.GameLogic(size)
         self.logic.reset_board()
         self.selected_piece = None
+        self.set_board_size(size)
 
         # Timers
         self.turn_time = 15
@@ -63,25 +253,20 @@ class Board(QWidget):
         self.highlight_timer.setSingleShot(True)
         self.highlight_timer.timeout.connect(self.clear_highlight)
 
-        self.burn_movie = QMovie(r'images/lava tile.gif')
-        self.burn_movie.frameChanged.connect(self.update)
+        # Lava frames come from the shared cache and are timed by the shared clock (start in clock ms)
         self.burn_animation_start = False
+        self.burn_started = 0
         # Forced-capture UI helpers
         self.forced_capture_positions = []
         self.forced_flash_state = False
-        self.forced_flash_timer = QTimer(self)
-        self.forced_flash_timer.setInterval(500)
-        self.forced_flash_timer.timeout.connect(lambda: (setattr(self, 'forced_flash_state', not self.forced_flash_state), self.update()))
 
         # UI Elements
         self.paused = False
         self.setup_ui()
         self.piece_placement()
 
-        # Lava GIF timer for smooth animation
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_lava_visuals)
-        self.timer.start(100)
+        self.clock = shared_clock()
+        self.clock.add(self)
 
     # Create and arrange UI controls (buttons, labels, counters)
     def setup_ui(self):
@@ -199,6 +384,16 @@ class Board(QWidget):
                                                 Qt.TransformationMode.SmoothTransformation))
         self.winner_image.hide()
 
+    # Use the square geometry for a size x size board; a game of another size is replaced by a new one
+    def set_board_size(self, size):
+        self.grid = board_grid(size)
+        sq = self.grid.square_size
+        for name, path in PIECE_IMAGES.items():
+            setattr(self, name, self.assets.pixmap(path, sq, sq))
+        if self.logic.size != size:
+            self.logic = logic.GameLogic(size)
+            self.logic.reset_board()
+
     # Reset and place pieces on the board, then refresh visuals
     def piece_placement(self):
         self.logic.reset_board()
@@ -217,8 +412,7 @@ class Board(QWidget):
     def update_burn_button_visibility(self):
         self.red_burn_btn.hide()
         self.blue_burn_btn.hide()
-        kings_with_power = [p for p in self.logic.pieces if p.color==self.logic.current_turn and getattr(p,"king",False) and getattr(p,"power_up",False)]
-        if kings_with_power and not self.logic.multi_capture_piece and not self.awaiting_burn:
+        if self.logic.move_table().burn_cols and not self.awaiting_burn:
             if self.logic.current_turn=="red": self.red_burn_btn.show()
             else: self.blue_burn_btn.show()
 
@@ -226,6 +420,8 @@ class Board(QWidget):
     def set_player_info(self, info):
         self.player_info = info
         padding = 10
+        if self.autosave is not None:
+            self.autosave.compact()
 
         for color in ["red", "blue"]:
             if color == "red":
@@ -261,6 +457,9 @@ class Board(QWidget):
 
     # Handle board clicks: select/move pieces and enforce captures
     def click_handle(self, row, col):
+        # Ignore clicks while the computer opponent is to move
+        if self.computer is not None and self.logic.current_turn == self.computer.color:
+            return
         clicked_piece = self.logic.get_piece(row, col)
         # Prevent any pending highlight-clear from removing new highlights
         try:
@@ -288,19 +487,20 @@ class Board(QWidget):
                 self.selected_piece = (cap.row, cap.col)
                 # highlight only capture moves for this piece
                 self.highlight_timer.stop()
-                self.highlight_moves = self.logic.get_valid_moves(cap, capture=True)
+                self.highlight_moves = self.logic.move_targets(cap.row, cap.col)
 
         if self.selected_piece is None:
             # Select piece if it's the current player's turn
             if clicked_piece and clicked_piece.color == self.logic.current_turn:
                 self.selected_piece = (row, col)
                 self.highlight_timer.stop()
-                self.highlight_moves = self.logic.get_valid_moves(clicked_piece)
+                self.highlight_moves = self.logic.move_targets(row, col)
         else:
             s_row, s_col = self.selected_piece
             moved = self.logic.move_piece(s_row, s_col, row, col)
 
             if moved:
+                self.record_action(('move', s_row, s_col, row, col))
                 # Stop any pending clear and update highlights for the continued capture or clear
                 self.highlight_timer.stop()
                 self.highlight_moves.clear()
@@ -310,13 +510,15 @@ class Board(QWidget):
                     self.selected_piece = (piece.row, piece.col)
                     # highlight only capture moves for this piece
                     self.highlight_timer.stop()
-                    self.highlight_moves = self.logic.get_valid_moves(piece, capture=True)
+                    self.highlight_moves = self.logic.move_targets(piece.row, piece.col)
                 else:
                     # No further captures, end turn
                     self.selected_piece = None
                     self.highlight_timer.start(1000)
                     self.turn_time = 15
                 self.update_board_piece()
+                if self.logic.multi_capture_piece is None:
+                    self.schedule_computer_turn()
             else:
                 # Invalid move, deselect
                 self.selected_piece = None
@@ -330,24 +532,19 @@ class Board(QWidget):
         if not self.timer_active or self.paused or self.winner_label.isVisible():
             return
         self.turn_time -= 1
+        if self.autosave is not None:
+            self.autosave.clock(self.turn_time)
+        # Moves always publish a fresh 15s clock; spectators see the countdown from these ticks
+        if self.spectator_feed is not None and self.turn_time > 0:
+            self.spectator_feed.publish(self.logic, self.turn_time)
         if self.turn_time <= 0:
             self.automatic_burn()
         self.timer_label.setText(f"Time: {self.turn_time}s")
         self.update_turn_icons()
         self.update_burn_button_visibility()
-        # Compute forced-capture highlights (pieces of current player that have captures)
-        try:
-            forced = [p for p in self.logic.pieces if p.color == self.logic.current_turn and self.logic.piece_has_capture(p)]
-            self.forced_capture_positions = [(p.row, p.col) for p in forced]
-        except Exception:
-            self.forced_capture_positions = []
-        # Start/stop forced highlight pulsing
-        if self.forced_capture_positions:
-            if not self.forced_flash_timer.isActive():
-                self.forced_flash_timer.start()
-        else:
-            if self.forced_flash_timer.isActive():
-                self.forced_flash_timer.stop()
+        # Forced-capture highlights (pieces of current player that have captures), from the turn's move table
+        self.forced_capture_positions = list(self.logic.move_table().capture_squares)
+        # The pulse itself follows the shared clock (see advance)
 
     # Activate the king-column burn power for `color` (targets king's column)
     def prepare_burn(self, color):
@@ -371,38 +568,41 @@ class Board(QWidget):
 
         # Perform burn in the king's column (logic.burn_column will end the turn)
         if self.logic.burn_column(col):
+            self.record_action(('burn', col))
             # Start burn animation and schedule finish
             self.active_burn_column = col
-            self.burn_animation_start = True
-            self.burn_movie.jumpToFrame(0)
-            self.burn_movie.start()
-
-            frame_count = self.burn_movie.frameCount()
-            frame_delay = self.burn_movie.nextFrameDelay() or 100
-            total_duration = frame_count * frame_delay
-
-            QTimer.singleShot(total_duration, lambda: self.finish_burn_column(col))
+            self.start_burn_animation(lambda: self.finish_burn_column(col))
 
             # Clear selection and UI state while animation plays
             self.selected_piece = None
             self.highlight_moves = []
             self.update_burn_button_visibility()
             return
+    # Play the lava animation once from the shared clock, then call `finish`
+    def start_burn_animation(self, finish):
+        frames, delay = self.assets.frames(LAVA_ANIMATION)
+        self.burn_animation_start = True
+        self.burn_started = self.clock.now()
+        self.update()
+        QTimer.singleShot(len(frames) * delay, finish)
+
     # Finish burn animation for a column and start next player's timer
     def finish_burn_column(self, col):
         self.active_burn_column = None
         self.burn_animation_start = False
-        self.burn_movie.stop()
         # burn_column already ended the turn; just clear temporary state
         self.logic.multi_capture_piece = None
         self.turn_time = 15
         self.update_board_piece()
         if not self.winner_label.isVisible():
             self.turn_timer.start(1000)
+        self.schedule_computer_turn()
 
     # Perform an automatic random burn (used when the timer runs out)
     def automatic_burn(self):
         self.turn_timer.stop()
+        if self.computer is not None:
+            self.computer.stop_pondering()
         current_color = self.logic.current_turn
         player_pieces = [p for p in self.logic.pieces if p.color==current_color]
         if not player_pieces:
@@ -412,78 +612,114 @@ class Board(QWidget):
             return
         piece_to_burn = random.choice(player_pieces)
         self.random_burn_pos = (piece_to_burn.row,piece_to_burn.col)
-        self.burn_animation_start=True
-        self.burn_movie.jumpToFrame(0)
-        self.burn_movie.start()
-        frame_count = self.burn_movie.frameCount()
-        frame_delay = self.burn_movie.nextFrameDelay() or 100
-        total_duration = frame_count*frame_delay
-        QTimer.singleShot(total_duration,lambda:self.finish_random_burn(piece_to_burn))
+        self.start_burn_animation(lambda: self.finish_random_burn(piece_to_burn))
 
     # Finish a burn animation for `piece`, remove it and hand the turn
     def finish_random_burn(self,piece):
-        self.logic.pieces=[p for p in self.logic.pieces if not(p.row==piece.row and p.col==piece.col)]
-        if piece.color=="red": self.logic.red_captured+=1
-        else: self.logic.blue_captured+=1
+        move = ('timeout', piece.row, piece.col)
+        if self.logic.penalize_piece(piece):
+            self.record_action(move)
         self.random_burn_pos=None
         self.burn_animation_start=False
-        self.burn_movie.stop()
-        self.logic.multi_capture_piece = None
-        self.logic.end_turn()
         self.turn_time=15
         if not self.winner_label.isVisible(): self.turn_timer.start(1000)
         self.update_board_piece()
+        self.schedule_computer_turn()
+
+    # Let the computer play `opponent.color`; it ponders while the human is thinking
+    def set_computer_opponent(self, opponent):
+        if self.computer is not None:
+            self.computer.stop_pondering()
+        self.computer = opponent
+        if opponent is not None:
+            self.schedule_computer_turn()
+
+    # Queue the computer's turn when it is to move, otherwise ponder on the human's turn
+    def schedule_computer_turn(self):
+        if self.computer is None or self.winner_label.isVisible():
+            return
+        if self.logic.current_turn == self.computer.color:
+            QTimer.singleShot(0, self.computer_turn)
+        elif not self.paused:
+            self.computer.start_pondering(self.logic)
+
+    # Have the computer think about its whole turn on its worker thread; the GUI keeps running meanwhile
+    def computer_turn(self):
+        color = self.computer.color if self.computer is not None else None
+        if color != self.logic.current_turn or self.paused or self.burn_animation_start or self.computer_thinking:
+            return
+        if not self.timer_active:
+            self.timer_active = True
+            self.turn_timer.start(1000)
+        self.computer_thinking = True
+        key = self.logic.position_key()
+        self.computer.request_turn(self.logic, lambda moves: self.computer_turn_ready.emit(key, moves))
+
+    # Play the turn the computer chose, following capture chains; a burn hands over to the animation.
+    # An answer for a position that has moved on (pause, timeout burn, restart) is dropped and asked again
+    def play_computer_turn(self, key, moves):
+        self.computer_thinking = False
+        color = self.computer.color if self.computer is not None else None
+        if (moves is None or color != self.logic.current_turn or key != self.logic.position_key()
+                or self.paused or self.burn_animation_start):
+            self.schedule_computer_turn()
+            return
+        for move in moves:
+            if move[0] == 'burn':
+                king = next(p for p in self.logic.pieces if p.color == color and p.king and p.power_up and p.col == move[1])
+                self.selected_piece = (king.row, king.col)
+                self.prepare_burn(color)
+                return
+            self.logic.apply_move(move)
+            self.record_action(move)
+        self.selected_piece = None
+        self.highlight_moves.clear()
+        self.turn_time = 15
+        self.update_board_piece()
+        self.schedule_computer_turn()
 
     # Paint the board, pieces, highlights and animations
     def paintEvent(self,event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        offset_x = (self.width()-WINDOW_SIZE)//2
-        offset_y = Y_OFFSET
+        grid = self.grid
+        sq = grid.square_size
 
         painter.drawPixmap(0,0,self.width(),self.height(),self.board_bg)
 
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                color = LIGHT_COLOR if (row+col)%2==0 else DARK_COLOR
-                painter.fillRect(offset_x+col*SQUARE_SIZE,offset_y+row*SQUARE_SIZE,SQUARE_SIZE,SQUARE_SIZE,color)
+        for rect, color in grid.cells:
+            painter.fillRect(rect, color)
 
         # Highlight
-        for row,col in self.highlight_moves:
-            painter.fillRect(offset_x+col*SQUARE_SIZE,offset_y+row*SQUARE_SIZE,SQUARE_SIZE,SQUARE_SIZE,HIGHLIGHT_COLOR)
+        for square in self.highlight_moves:
+            painter.fillRect(grid.rects[square], HIGHLIGHT_COLOR)
 
         # Forced-capture pulsing highlight
         if getattr(self, 'forced_capture_positions', None):
             alpha = 220 if getattr(self, 'forced_flash_state', False) else 100
             overlay = QColor(0, 200, 0)
             overlay.setAlpha(alpha)
-            thickness = 6
-            for row, col in self.forced_capture_positions:
-                x = offset_x + col * SQUARE_SIZE
-                y = offset_y + row * SQUARE_SIZE
-                painter.fillRect(x, y, SQUARE_SIZE, thickness, overlay)
-                painter.fillRect(x, y + SQUARE_SIZE - thickness, SQUARE_SIZE, thickness, overlay)
-                painter.fillRect(x, y + thickness, thickness, SQUARE_SIZE - 2 * thickness, overlay)
-                painter.fillRect(x + SQUARE_SIZE - thickness, y + thickness, thickness, SQUARE_SIZE - 2 * thickness, overlay)
+            for square in self.forced_capture_positions:
+                for edge in grid.frames[square]:
+                    painter.fillRect(edge, overlay)
 
         # Burn animations
         if self.random_burn_pos:
-            row,col = self.random_burn_pos
-            frame = self.burn_movie.currentPixmap()
-            scaled_frame = frame.scaled(SQUARE_SIZE,SQUARE_SIZE,Qt.AspectRatioMode.KeepAspectRatioByExpanding)
-            painter.drawPixmap(offset_x+col*SQUARE_SIZE,offset_y+row*SQUARE_SIZE,SQUARE_SIZE,SQUARE_SIZE,scaled_frame)
+            frames, delay = self.assets.frames(LAVA_ANIMATION, sq, sq)
+            index = min((self.clock.now() - self.burn_started) // delay, len(frames) - 1)
+            painter.drawPixmap(grid.rects[self.random_burn_pos],frames[index])
         elif self.burn_animation_start and self.active_burn_column is not None:
-            col = self.active_burn_column
-            frame = self.burn_movie.currentPixmap()
-            scaled_frame = frame.scaled(SQUARE_SIZE,BOARD_PIX,Qt.AspectRatioMode.KeepAspectRatioByExpanding)
-            painter.drawPixmap(offset_x+col*SQUARE_SIZE,offset_y,SQUARE_SIZE,BOARD_PIX,scaled_frame)
+            column = grid.columns[self.active_burn_column]
+            frames, delay = self.assets.frames(LAVA_ANIMATION, sq, column.height())
+            index = min((self.clock.now() - self.burn_started) // delay, len(frames) - 1)
+            painter.drawPixmap(column,frames[index])
 
         # Pieces
         for piece in self.logic.pieces:
             pixmap = self.red_king if getattr(piece,"king",False) and piece.color=="red" else \
                      self.blue_king if getattr(piece,"king",False) and piece.color=="blue" else \
                      self.red_piece if piece.color=="red" else self.blue_piece
-            painter.drawPixmap(offset_x+piece.col*SQUARE_SIZE,offset_y+piece.row*SQUARE_SIZE,SQUARE_SIZE,SQUARE_SIZE,pixmap)
+            painter.drawPixmap(grid.rects[(piece.row,piece.col)],pixmap)
 
     # Refresh board UI and optionally restart the per-turn timer
     def update_board_piece(self):
@@ -497,10 +733,61 @@ class Board(QWidget):
             self.winner_label.show()
             self.restart_btn.show()
             self.paused=True
+        # A finished game is not worth restoring
+        if self.autosave is not None:
+            if winner:
+                self.autosave.discard()
+            else:
+                self.autosave.clock(self.turn_time)
         self.update_turn_icons()
         self.update_burn_button_visibility()
+        if self.spectator_feed is not None:
+            self.spectator_feed.publish(self.logic, self.turn_time)
         self.update()
 
+    # Attach a spectator feed; fan-out is batched per Qt event-loop pass
+    def attach_spectators(self, feed=None):
+        if feed is None:
+            feed = spectator.SpectatorFeed(scheduler=lambda callback: QTimer.singleShot(0, callback))
+        self.spectator_feed = feed
+        feed.publish(self.logic, self.turn_time, full=True)
+        return feed
+
+    # Journal every action and clock change to `directory` so the game survives a crash
+    def attach_autosave(self, directory, seq=0):
+        self.autosave = autosave.Journal(directory, self.autosave_state, seq)
+        return self.autosave
+
+    # Log an action the game just applied to the autosave journal
+    def record_action(self, move):
+        if self.autosave is not None:
+            self.autosave.record(move)
+
+    # Live state for an autosave snapshot; profile images are kept as file paths
+    def autosave_state(self):
+        info = getattr(self, 'player_info', None) or {}
+        return {
+            "game": autosave.game_state(self.logic),
+            "turn_time": self.turn_time,
+            "profiles": {color: {"name": p["name"], "img": p.get("path")} for color, p in info.items()},
+        }
+
+    # Continue a game recovered by autosave.load; returns the restored player info
+    def restore_autosave(self, saved):
+        self.logic = saved.game
+        self.set_board_size(self.logic.size)
+        self.turn_time = saved.turn_time
+        self.selected_piece = None
+        self.highlight_moves.clear()
+        info = {color: {"name": p["name"], "img": QPixmap(p["img"]) if p["img"] else None, "path": p["img"]}
+                for color, p in saved.profiles.items()}
+        if info:
+            self.set_player_info(info)
+        elif self.autosave is not None:
+            self.autosave.compact()
+        self.update_board_piece()
+        return info
+
     # Clear temporary move highlights
     def clear_highlight(self):
         self.highlight_moves.clear()
@@ -510,6 +797,8 @@ class Board(QWidget):
     def toggle_pause(self):
         self.paused = not self.paused
         if self.paused:
+            if self.computer is not None:
+                self.computer.stop_pondering()
             self.pause_label.show()
             self.pause_btn.hide()
             self.blue_burn_btn.hide()
@@ -520,6 +809,7 @@ class Board(QWidget):
             self.pause_btn.show()
             self.timer_label.show()
             self.update_burn_button_visibility()
+            self.schedule_computer_turn()
         self.update()
 
     # Handle key presses (Escape toggles pause)
@@ -529,35 +819,22 @@ class Board(QWidget):
 
     # Map mouse clicks to board coordinates and delegate to click handler
     def mousePressEvent(self, event):
-        offset_x = (self.width() - WINDOW_SIZE) // 2
-        offset_y = Y_OFFSET
         pos = event.position()
-        x_click = int(pos.x() - offset_x)
-        y_click = int(pos.y() - offset_y)
-        col = x_click // SQUARE_SIZE
-        row = y_click // SQUARE_SIZE
+        row, col = self.grid.square_at(pos.x(), pos.y())
+        size = self.grid.size
 
         if self.paused:
             self.toggle_pause()
             return
 
         # ---------------- King Burn Handling ----------------
-        if self.awaiting_burn and 0 <= col < BOARD_SIZE:
+        if self.awaiting_burn and 0 <= col < size:
             # Attempt burn
             if self.logic.burn_column(col):
+                self.record_action(('burn', col))
                 # Start burn animation
                 self.active_burn_column = col
-                self.burn_animation_start = True
-                self.burn_movie.jumpToFrame(0)
-                self.burn_movie.start()
-
-                # Calculate total animation duration
-                frame_count = self.burn_movie.frameCount()
-                frame_delay = self.burn_movie.nextFrameDelay() or 100
-                total_duration = frame_count * frame_delay
-
-                # Finish burn after animation
-                QTimer.singleShot(total_duration, lambda: self.finish_burn_column(col))
+                self.start_burn_animation(lambda: self.finish_burn_column(col))
 
             self.awaiting_burn = False
             self.update_burn_button_visibility()
@@ -565,17 +842,31 @@ class Board(QWidget):
             return
 
         # ---------------- Regular Piece Handling ----------------
-        if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
+        if 0 <= row < size and 0 <= col < size:
             self.click_handle(row, col)
 
-    # Trigger periodic visual updates for burn animations
-    def update_lava_visuals(self):
-        if self.burn_animation_start: self.update()
+    def is_onscreen(self):
+        return self.isVisible() and not self.visibleRegion().isEmpty()
+
+    # Shared clock tick: repaint while lava runs or when the forced-capture pulse changes phase
+    def advance(self, now):
+        dirty = self.burn_animation_start
+        if self.forced_capture_positions:
+            flash = self.clock.flash_on(now)
+            if flash != self.forced_flash_state:
+                self.forced_flash_state = flash
+                dirty = True
+        if dirty:
+            self.update()
 
     # Reset game state and restart from the initial position
     def restart_game(self):
+        if self.computer is not None:
+            self.computer.stop_pondering()
         self.logic.reset_board()
         self.turn_time = 15
+        if self.autosave is not None:
+            self.autosave.compact()
         self.paused = False
         self.selected_piece = None
         self.highlight_moves.clear()
@@ -583,8 +874,8 @@ class Board(QWidget):
         self.restart_btn.hide()
         self.random_burn_pos=None
         self.burn_animation_start=False
-        self.burn_movie.stop()
         self.update_board_piece()
+        self.schedule_computer_turn()
 
 
 class MenuWidget(QWidget):
@@ -670,6 +961,7 @@ class MenuWidget(QWidget):
             if ok and blue_name.strip() != "":
                 self.player_info["blue"]["name"] = blue_name
                 self.player_info["blue"]["img"] = QPixmap(blue_img)
+                self.player_info["blue"]["path"] = blue_img
         # Red player
             red_img, _ = QFileDialog.getOpenFileName(self, "Select Red Player Image", "", "Images (*.png *.jpg *.bmp)")
             if red_img:
@@ -677,6 +969,7 @@ class MenuWidget(QWidget):
                 if ok and red_name.strip() != "":
                     self.player_info["red"]["name"] = red_name
                     self.player_info["red"]["img"] = QPixmap(red_img)
+                    self.player_info["red"]["path"] = red_img
 
     # Start a new game by switching to the play view and applying player info
     def start_game(self):
@@ -693,7 +986,7 @@ class MenuWidget(QWidget):
 
 class EmberLord(QWidget):
     # Top-level application window and view stack manager
-    def __init__(self):
+    def __init__(self, board_size=BOARD_SIZE):
         super().__init__()
         self.icon_image = QPixmap(r'images/emberlord_icon.png').scaled(
             32, 13, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
@@ -706,7 +999,7 @@ class EmberLord(QWidget):
         self.stack = QStackedWidget(self)
         self.menu = MenuWidget(self)
         self.menu.main_window = self
-        self.board = Board()
+        self.board = Board(size=board_size)
 
         self.stack.addWidget(self.menu)
         self.stack.addWidget(self.board)
@@ -722,6 +1015,13 @@ class EmberLord(QWidget):
 
         self.show()
 
+    # Reopen a game recovered by autosave.load straight into the play view
+    def restore_autosave(self, saved):
+        info = self.board.restore_autosave(saved)
+        if info:
+            self.menu.player_info = info
+        self.stack.setCurrentWidget(self.board)
+
     # Play a blur transition and switch to the requested view
     def transition_to(self, new_state):
         current_pixmap = self.grab()